@@ -0,0 +1,266 @@
+"""
+hexwordify benchmarks
+
+Measures transform, finder and command line throughput on generated inputs.
+Results are printed as JSON, can be saved as a baseline and compared against
+one, failing if anything got slower than the allowed threshold.
+
+Example:
+    python benchmarks/bench.py --save baseline.json
+    python benchmarks/bench.py --compare baseline.json --threshold 0.2
+"""
+import argparse
+import collections
+import fnmatch
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import hexwordify  # noqa: E402  pylint: disable=wrong-import-position
+
+SEED = 1814
+WORDS = ("pub", "sub", "uid", "rsa4096", "key", "expires", "[ultimate]",
+         "Dimitris", "Zervas", "2015-01-25", "[SC]", "[E]")
+
+
+def hex_string(rand, size):
+    """Random hex string of `size` characters"""
+    return "%0*x" % (size, rand.getrandbits(size * 4))
+
+
+def text(rand, size, density, hex_size=40):
+    """
+    Random log-like text of about `size` characters, where `density` of the
+    tokens are hex strings
+    """
+    lines = []
+    length = 0
+
+    while length < size:
+        line = " ".join(hex_string(rand, hex_size) if rand.random() < density
+                        else rand.choice(WORDS) for _ in range(8))
+        lines.append(line)
+        length += len(line) + 1
+
+    return "\n".join(lines) + "\n"
+
+
+def nested(rand, depth, width):
+    """Nested dicts and lists with hex strings as leaves"""
+    if not depth:
+        return hex_string(rand, 40)
+
+    if depth % 2:
+        return [nested(rand, depth - 1, width) for _ in range(width)]
+
+    return {"k%d" % i: nested(rand, depth - 1, width) for i in range(width)}
+
+
+def transform_cases(rand, quick):
+    """transform on a single hex string of growing length"""
+    sizes = (16, 64, 1024, 16384) if quick else \
+        (16, 64, 1024, 16384, 262144, 1048576)
+
+    for size in sizes:
+        string = hex_string(rand, size)
+        yield "transform/%d" % size, size, \
+            lambda string=string: hexwordify.transform(string)
+
+        # The same value as raw bytes, as a hash digest would be given
+        raw = bytes.fromhex(string)
+        yield "transform-bytes/%d" % size, size, \
+            lambda raw=raw: hexwordify.transform(raw)
+
+
+def radix_cases(rand, quick):
+    """
+    Mixed-radix transform and decode against the bit mask transform, on a
+    wordlist whose length is not a power of 2 (as long as the EFF list)
+    """
+    wordlist = ["w%d" % i for i in range(7776)]
+    sizes = (16, 64, 1024, 16384) if quick else (16, 64, 1024, 16384, 262144)
+
+    for size in sizes:
+        string = hex_string(rand, size)
+        words = hexwordify.transform(string, wordlist, radix=True)
+
+        yield "transform-mask-7776/%d" % size, size, \
+            lambda string=string: hexwordify.transform(string, wordlist)
+        yield "transform-radix-7776/%d" % size, size, \
+            lambda string=string: hexwordify.transform(string, wordlist,
+                                                       radix=True)
+        yield "decode-radix-7776/%d" % size, size, \
+            lambda words=words, size=size: hexwordify.decode(
+                words, wordlist, length=size, radix=True)
+
+
+def finder_cases(rand, quick):
+    """finder on text of varying hex density and on pathological input"""
+    size = 1 << (18 if quick else 20)
+    inputs = {
+        "none": text(rand, size, 0),
+        "sparse": text(rand, size, 0.01),
+        "normal": text(rand, size, 0.1),
+        "dense": text(rand, size, 0.9),
+        # Long colon only runs are matched too
+        "colons": (":" * 1000 + " ") * (size // 1001),
+        # Runs just under min_size make the regex retry at every position
+        "under-min-size": (hex_string(rand, 31) + " ") * (size // 32),
+    }
+
+    for name, string in inputs.items():
+        yield "finder/%s" % name, len(string), \
+            lambda string=string: hexwordify.finder(string, min_size=32)
+        yield "finder-scan/%s" % name, len(string), \
+            lambda string=string: hexwordify.finder(string, min_size=32,
+                                                    engine="scan")
+
+    for depth, width in ((4, 10), (8, 4)):
+        value = nested(rand, depth, width)
+        yield "finder/nested-%dx%d" % (depth, width), \
+            len(json.dumps(value)), \
+            lambda value=value: hexwordify.finder(value, min_size=32)
+
+
+def reverse_cases(rand, quick):
+    """reverse_finder on the words of text of varying hex density"""
+    size = 1 << (18 if quick else 20)
+
+    for density in (0, 0.01, 0.1):
+        string = hexwordify.finder(text(rand, size, density), min_size=32)
+        yield "reverse/%s" % density, len(string), \
+            lambda string=string: hexwordify.reverse_finder(string)
+
+
+def ndjson_cases(rand, quick):
+    """ndjson.rewrite on records of a nested document each, and deep ones"""
+    count = 100 if quick else 1000
+    lines = [json.dumps(nested(rand, 4, 4)) + "\n" for _ in range(count)]
+    find = hexwordify.Finder(min_size=32)
+
+    for name, paths in (("all", None), ("path", ["k1.*.k2"])):
+        yield "ndjson/%s" % name, sum(map(len, lines)), \
+            lambda paths=paths: collections.deque(
+                hexwordify.ndjson.rewrite(lines, find, paths), maxlen=0)
+
+    depth = 10000 if quick else 100000
+    line = "[" * depth + json.dumps(hex_string(rand, 40)) + "]" * depth
+    yield "ndjson/deep-%d" % depth, len(line), \
+        lambda: collections.deque(hexwordify.ndjson.rewrite([line], find),
+                                  maxlen=0)
+
+
+def cli_cases(rand, quick):
+    """End to end `python -m hexwordify` on a generated file"""
+    size = 1 << (20 if quick else 23)
+    corpus = tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False)
+    with corpus:
+        corpus.write(text(rand, size, 0.1))
+
+    env = dict(os.environ, PYTHONPATH=ROOT)
+
+    try:
+        for name, args in (("cli/file", []), ("cli/stream", ["-l"]),
+                           ("cli/mmap", ["-m"])):
+            command = [sys.executable, "-m", "hexwordify", "-c", "-f",
+                       corpus.name] + args
+            yield name, size, lambda command=command: subprocess.run(
+                command, env=env, stdout=subprocess.DEVNULL, check=True)
+    finally:
+        os.unlink(corpus.name)
+
+
+CASES = (transform_cases, radix_cases, finder_cases, reverse_cases,
+         ndjson_cases, cli_cases)
+
+
+def measure(function, repeat):
+    """Best time of `repeat` runs, auto-ranging fast functions"""
+    timer = timeit.Timer(function)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat, number)) / number
+
+
+def run(pattern, repeat, quick):
+    """Runs the benchmarks whose name matches `pattern`"""
+    rand = random.Random(SEED)
+    results = {}
+
+    for cases in CASES:
+        for name, size, function in cases(rand, quick):
+            if not fnmatch.fnmatch(name, pattern):
+                continue
+
+            seconds = measure(function, repeat)
+            results[name] = {"seconds": seconds,
+                             "mb_per_s": size / seconds / 1e6}
+            sys.stderr.write("%-28s %12.6fs %10.2f MB/s\n" %
+                             (name, seconds, results[name]["mb_per_s"]))
+
+    return results
+
+
+def compare(results, baseline, threshold):
+    """Returns the benchmarks that got slower than the threshold allows"""
+    regressions = {}
+
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+
+        ratio = result["seconds"] / baseline[name]["seconds"]
+        if ratio > 1 + threshold:
+            regressions[name] = ratio
+
+    return regressions
+
+
+def main():
+    """
+    Main benchmark function
+    """
+    parse = argparse.ArgumentParser(description=__doc__,
+                                    formatter_class=argparse.
+                                    RawDescriptionHelpFormatter)
+    parse.add_argument("-k", "--filter", default="*",
+                       help="Run only benchmarks matching this glob")
+    parse.add_argument("-r", "--repeat", type=int, default=5,
+                       help="Times to run each benchmark, the best counts")
+    parse.add_argument("-q", "--quick", action="store_true",
+                       help="Use smaller inputs")
+    parse.add_argument("--save", metavar="FILE",
+                       help="Save the results as a baseline")
+    parse.add_argument("--compare", metavar="FILE",
+                       help="Compare the results against a baseline")
+    parse.add_argument("--threshold", type=float, default=0.2,
+                       help="Allowed slowdown against the baseline \
+                            (default: %(default)s)")
+    args = parse.parse_args()
+
+    results = run(args.filter, args.repeat, args.quick)
+    print(json.dumps(results, indent=2, sort_keys=True))
+
+    if args.save:
+        with open(args.save, "w") as fileo:
+            json.dump(results, fileo, indent=2, sort_keys=True)
+
+    if args.compare:
+        with open(args.compare) as fileo:
+            regressions = compare(results, json.load(fileo), args.threshold)
+
+        for name, ratio in sorted(regressions.items()):
+            sys.stderr.write("REGRESSION %s: %.2fx slower\n" % (name, ratio))
+
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+hexwordify startup budget
+
+Measures the import time of the package with `python -X importtime`, for
+`import hexwordify` and for a plain `hexwordify <hex string>` call, and fails
+if the best of the runs is over its budget. Prompts and scripts run the
+command once per call, the startup time is most of what they wait for.
+
+Example:
+    python benchmarks/startup.py
+    python benchmarks/startup.py --import-budget 5 --cli-budget 15
+"""
+import argparse
+import compileall
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Budgets in milliseconds
+IMPORT_BUDGET = 5.0
+CLI_BUDGET = 15.0
+
+CASES = {
+    "import": ["-c", "import hexwordify"],
+    "cli": ["-m", "hexwordify", "-c", "DEADBEEF"],
+}
+
+
+def import_time(args):
+    """
+    Milliseconds spent importing the package modules in a new interpreter,
+    the cumulative time of the top level imports of hexwordify modules
+    """
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    result = subprocess.run([sys.executable, "-X", "importtime"] + args,
+                            env=env, stdout=subprocess.DEVNULL,
+                            stderr=subprocess.PIPE, check=True,
+                            universal_newlines=True)
+    total = 0
+
+    # import time: self [us] | cumulative | imported package
+    for line in result.stderr.splitlines():
+        fields = line.split("|")
+
+        if len(fields) != 3 or not fields[1].strip().isdigit():
+            continue
+
+        name = fields[2]
+        # Nested imports are indented, they are in the cumulative time
+        if name.startswith(" hexwordify"):
+            total += int(fields[1])
+
+    return total / 1000
+
+
+def main():
+    """
+    Main startup budget function
+    """
+    parse = argparse.ArgumentParser(description=__doc__,
+                                    formatter_class=argparse.
+                                    RawDescriptionHelpFormatter)
+    parse.add_argument("-r", "--repeat", type=int, default=10,
+                       help="Times to run each case, the best counts")
+    parse.add_argument("--import-budget", type=float, default=IMPORT_BUDGET,
+                       help="Milliseconds `import hexwordify` may take \
+                            (default: %(default)s)")
+    parse.add_argument("--cli-budget", type=float, default=CLI_BUDGET,
+                       help="Milliseconds of imports `hexwordify <hex>` may \
+                            take (default: %(default)s)")
+    args = parse.parse_args()
+    budgets = {"import": args.import_budget, "cli": args.cli_budget}
+
+    # Stale bytecode would be compiled on every run and measured with it
+    compileall.compile_dir(os.path.join(ROOT, "hexwordify"), quiet=1)
+
+    results = {}
+    over = False
+
+    for name, command in CASES.items():
+        best = min(import_time(command) for _ in range(args.repeat))
+        results[name] = {"ms": best, "budget_ms": budgets[name]}
+        over |= best > budgets[name]
+
+        sys.stderr.write("%-8s %8.2fms (budget %.2fms)%s\n" % (
+            name, best, budgets[name],
+            " OVER BUDGET" if best > budgets[name] else ""))
+
+    print(json.dumps(results, indent=2, sort_keys=True))
+
+    if over:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,2 +1,78 @@
-from .bip_0039 import *
-from .hexwordify import *
+"""
+Turn hexadecimal strings to readable words.
+
+The names of the package are imported from their modules when first used,
+so `import hexwordify` stays fast (some modules import asyncio, numpy or
+multiprocessing) and only what is used gets loaded.
+"""
+import importlib
+import sys
+import types
+
+# Module of each name of the package
+_NAMES = {
+    "WORDLIST": "bip_0039",
+    "BINARY": "hexwordify", "BLOCK_SIZE": "hexwordify",
+    "ENGINES": "hexwordify", "Finder": "hexwordify", "finder": "hexwordify",
+    "transform": "hexwordify", "transform_iter": "hexwordify",
+    "transform_many": "hexwordify", "wrapper": "hexwordify",
+    "LRUCache": "cache", "cache_key": "cache",
+    "DiskCache": "diskcache",
+    "ScanMatch": "scanner", "scan": "scanner",
+    "STATS": "stats", "clock": "stats",
+    "radix_indices": "radix",
+    "CompiledWordlist": "wordlists",
+    "scan_file": "filescan", "sub_file": "filescan",
+    "read_files": "tree", "walk": "tree",
+    "WordIndex": "decode", "decode": "decode", "decode_many": "decode",
+    "distance": "decode",
+    "parallel_finder": "parallel",
+    "afinder": "aio",
+    "analyze": "analyze",
+    "Follower": "follow", "follow": "follow",
+    "ReverseFinder": "reverse", "reverse_finder": "reverse",
+    "traverse": "traverse",
+}
+
+# Modules of the package used as a namespace, like hexwordify.gpg.keys
+_MODULES = ("gpg", "ndjson", "output", "radix", "stats", "wordlists")
+
+__all__ = sorted(_NAMES) + list(_MODULES)
+
+
+def __getattr__(name):
+    if name in _NAMES:
+        value = getattr(importlib.import_module("." + _NAMES[name], __name__),
+                        name)
+    else:
+        try:
+            value = importlib.import_module("." + name, __name__)
+        except ModuleNotFoundError as err:
+            # Not a missing dependency of an existing module
+            if err.name != "%s.%s" % (__name__, name):
+                raise
+            raise AttributeError("module %r has no attribute %r" %
+                                 (__name__, name)) from None
+
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_NAMES) | set(_MODULES))
+
+
+class _Package(types.ModuleType):
+    """
+    The package module. Importing a submodule sets it as an attribute of the
+    package, but functions named like their module (analyze, decode, follow,
+    traverse) are what the package exports
+    """
+    def __setattr__(self, name, value):
+        if _NAMES.get(name) == name and isinstance(value, types.ModuleType):
+            return
+
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _Package
@@ -1,51 +1,78 @@
 """
-Console module
+Console entry point. Plain `hexwordify <hex string>...` calls, the common
+case in shell prompts, are answered without loading the argument parser,
+the regexes or the rest of the package. Anything else is handled by
+`hexwordify.cli`
 """
-import argparse
 import sys
-from hexwordify import finder
 
+HEXDIGITS = frozenset("0123456789abcdefABCDEF:")
+NO_COLOR = ("-c", "--no-color")
 
-def main():
+
+def _plain_hex(string):
+    """
+    Whether all of `string` is a hex string, with an optional "0x" and at
+    least a digit
+    """
+    if string[:2] in ("0x", "0X"):
+        string = string[2:]
+
+    return bool(string.strip(":")) and HEXDIGITS.issuperset(string)
+
+
+def fast_main(argv, stdout):
+    """
+    Writes the words of hex string arguments, the same as the full console
+    function does, if the arguments are only hex strings and -c
+
+    argv: <list> Arguments
+    stdout: <file> Output
+
+    return value: <bool> The arguments were handled
+    """
+    # -c before or after the hex strings, argparse takes them in one go
+    first, last = 0, len(argv)
+    while first < last and argv[first] in NO_COLOR:
+        first += 1
+    while last > first and argv[last - 1] in NO_COLOR:
+        last -= 1
+
+    strings = argv[first:last]
+
+    if not strings or not all(_plain_hex(string) for string in strings):
+        return False
+
+    # Imported here, only what `transform` needs is loaded
+    from hexwordify.hexwordify import transform
+
+    start, end = ("\x1b[32;1m", "\x1b[0m") if len(strings) == len(argv) \
+        else ("", "")
+    results = [(start + " ".join(transform(string)) + end).strip()
+               for string in strings]
+
+    stdout.write("\n".join(results).strip() + "\n")
+    stdout.flush()
+    return True
+
+
+def main(argv=None, stdin=None, stdout=None):
     """
     Main console function
+
+    argv: <list> Arguments, defaults to sys.argv[1:]
+    stdin: <file> Input, defaults to sys.stdin
+    stdout: <file> Output, defaults to sys.stdout
     """
-    parse = argparse.ArgumentParser(description=__doc__)
-    parse.add_argument("-c", "--no-color", action="store_true",
-                       help="Disable colored output")
-    parse.add_argument("-p", "--prepend", action="store_true",
-                       help="Prepend string given to output")
-    parse.add_argument("-r", "--no-replace", action="store_true",
-                       help="Ouput only found hex strings. Works like grep \
-                            (only used if no hex arguments are given)")
-    parse.add_argument("-s", "--min-size", type=int, default=32,
-                       help="Minimum hex string size to search for in input \
-                            (only used if no hex arguments are given)")
-    parse.add_argument("strings", metavar="hex_string", nargs="*",
-                       help="Hex strings to turn into words")
-    parse.add_argument("-f", "--file", metavar="FILE", action="append",
-                       help="File to read")
-    args = parse.parse_args()
-
-    if not args.strings and args.file is None:
-        args.strings = sys.stdin.read().split("\n")
-    elif args.strings:
-        args.min_size = 0
-
-    if args.file:
-        args.strings = []
-        for filep in args.file:
-            with open(filep) as fileo:
-                args.strings.append(fileo.read())
-
-    result = finder(args.strings, min_size=args.min_size,
-                    replace=not args.no_replace, prepend=args.prepend,
-                    color=not args.no_color)
-
-    if isinstance(result, list):
-        print("\n".join(result).strip())
-    else:
-        print(result)
+    argv = sys.argv[1:] if argv is None else argv
+
+    if fast_main(argv, stdout or sys.stdout):
+        return None
+
+    # Imported here, it loads argparse and most of the package
+    from hexwordify.cli import main as cli_main
+
+    return cli_main(argv, stdin, stdout)
 
 
 if __name__ == "__main__":
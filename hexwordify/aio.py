@@ -0,0 +1,79 @@
+"""
+asyncio `finder`. Small records are transformed inline, large ones in an
+executor so they don't block the event loop. Records are read only when the
+consumer asks for the next result, so a slow consumer bounds the memory used.
+"""
+import asyncio
+from .bip_0039 import WORDLIST
+from .hexwordify import _default_finder
+
+# Records at least this long are sent to the executor
+THRESHOLD = 64 * 1024
+
+
+async def _stream_records(reader):
+    """Async generator of lines of a StreamReader, of any length"""
+    while True:
+        pieces = []
+
+        while True:
+            try:
+                pieces.append(await reader.readuntil(b"\n"))
+                break
+            except asyncio.IncompleteReadError as err:
+                pieces.append(err.partial)
+                break
+            except asyncio.LimitOverrunError as err:
+                # Longer than the reader's limit, take it a piece at a time
+                pieces.append(await reader.readexactly(err.consumed))
+
+        line = b"".join(pieces)
+        if not line:
+            return
+
+        yield line
+
+
+async def _records(source):
+    """Async generator of the records of a StreamReader or async iterable"""
+    if isinstance(source, asyncio.StreamReader):
+        records = _stream_records(source)
+    else:
+        records = source
+
+    async for record in records:
+        if isinstance(record, bytes):
+            record = record.decode(errors="replace")
+        yield record
+
+
+# pylint: disable=too-many-arguments,dangerous-default-value
+async def afinder(source, min_size=16, replace=True, prepend=False,
+                  color=False, wordlist=WORDLIST, threshold=THRESHOLD,
+                  executor=None, cache=None):
+    """
+    Async generator that runs `finder` on each record (line) of `source` and
+    yields the resulting lines, like `Finder.lines`.
+
+    source: <StreamReader, async iterable> Records to search, str or bytes
+    threshold: <int> Records at least this long are transformed in `executor`
+    executor: <Executor> Executor for large records, defaults to the
+              event loop's default executor
+
+    See `finder` for the rest of the arguments
+
+    Example:
+        >>> async for line in hexwordify.afinder(reader, min_size=32):
+        ...     writer.write(line.encode())
+    """
+    find = _default_finder(min_size, replace, prepend, color, wordlist, cache)
+    loop = asyncio.get_running_loop()
+
+    async for record in _records(source):
+        if len(record) < threshold:
+            result = find(record)
+        else:
+            result = await loop.run_in_executor(executor, find, record)
+
+        if replace or result:
+            yield result + "\n"
@@ -0,0 +1,213 @@
+"""
+Look-alike analysis of a set of fingerprints. Finds the pairs whose first
+`k` words are the same, or differ by a single word (changed, added or
+removed). Instead of comparing every pair, each phrase is put in a bucket by
+its words and by its words with one of them deleted (a deletion
+neighbourhood): two phrases within one word edit of each other always share
+a bucket, so only phrases in the same bucket are compared. Changed words
+are indexed the same way (by their letters with some deleted), so with a
+maximum distance only phrases whose changed words may look alike are.
+
+Example:
+    >>> for pair in hexwordify.analyze(fingerprints, k=4):
+    ...     print(pair.kind, pair.first, pair.second)
+"""
+import collections
+import itertools
+from .bip_0039 import WORDLIST
+from .decode import distance
+from .hexwordify import _indices, _word_bits
+
+# Kinds of pairs, by how their first k words differ
+COLLISION = "collision"
+SUBSTITUTION = "substitution"
+SHIFT = "shift"
+
+# `progress` is called every this many fingerprints
+PROGRESS_EVERY = 10000
+
+# first and second are the names of the fingerprints. position is the first
+# word that differs (None for collisions), words the differing words of a
+# substitution and their edit distance
+Pair = collections.namedtuple("Pair", ("kind", "first", "second",
+                                       "position", "words", "distance"))
+
+
+def _compare(first, second):
+    """
+    Kind of difference and first differing position of two phrases within
+    one word edit
+    """
+    if first == second:
+        return COLLISION, None
+
+    position = 0
+    while position < min(len(first), len(second)) and \
+            first[position] == second[position]:
+        position += 1
+
+    if len(first) == len(second) and \
+            first[position + 1:] == second[position + 1:]:
+        return SUBSTITUTION, position
+
+    return SHIFT, position
+
+
+def _phrases(fingerprints, k, bits):
+    """Generator of (name, first k word indices) of each fingerprint"""
+    for item in fingerprints:
+        if isinstance(item, (tuple, list)):
+            name, string = item
+        else:
+            name = string = item
+
+        # Long strings are streamed, only the first k words are needed
+        yield name, tuple(itertools.islice(_indices(string, bits), k))
+
+
+# The list is not altered, so its not a dangerous default value anymore:
+# pylint: disable=dangerous-default-value,too-many-locals
+def analyze(fingerprints, k=4, max_distance=None, wordlist=WORDLIST,
+            progress=None):
+    """
+    Generator of the pairs of fingerprints whose first `k` words collide or
+    nearly collide (one word changed, added or removed). Each fingerprint is
+    compared only with the ones sharing a bucket, and with `max_distance`
+    only with the ones whose changed word may be within it. So the time
+    grows with the pairs in the same buckets, mostly the pairs found, not
+    with every pair. Small `k` with fingerprints whose leading word has few
+    bits (like 40 digit ones) puts most of them in a few buckets.
+
+    fingerprints: <iterable> Hex strings, or (name, hex string) pairs
+    k: <int> Words of each phrase that are compared
+    max_distance: <int> Report substitutions only if the two words are within
+                  this many edits (look-alike words), None for all
+    wordlist: <tuple, list, CompiledWordlist> Tuple containing words
+    progress: <function> Called with the number of fingerprints indexed and
+              the pairs found up to now, every PROGRESS_EVERY fingerprints
+
+    return value: <generator> Yields a Pair for each pair found
+
+    Example:
+        >>> list(hexwordify.analyze(["DEADBEEF00", "DEADBEEF01"], k=3))
+            [Pair(kind='collision', first='DEADBEEF00', second='DEADBEEF01',
+            position=None, words=None, distance=None)]
+    """
+    if k < 1:
+        raise ValueError("k has to be at least 1")
+
+    bits = _word_bits(wordlist)
+    if not bits:
+        return
+
+    words = [word.strip() for word in wordlist]
+    # Bucket key: {dropped position: {dropped word: phrase indices of every
+    # fingerprint in it}}. The whole phrase is in the bucket of position None
+    buckets = {}
+    names = []
+    phrases = []
+    seen = set()
+    look_alikes = None if max_distance is None else \
+        _look_alikes(words, max_distance)
+
+    for number, (name, phrase) in enumerate(_phrases(fingerprints, k, bits)):
+        names.append(name)
+        phrases.append(phrase)
+
+        keys = {phrase: (None, None)}
+        for drop in range(len(phrase)):
+            keys.setdefault(phrase[:drop] + phrase[drop + 1:],
+                            (drop, words[phrase[drop]].lower()))
+
+        for key, (drop, word) in keys.items():
+            bucket = buckets.setdefault(key, {})
+
+            for other in _candidates(bucket, drop, word, look_alikes):
+                if (other, number) in seen:
+                    continue
+
+                found = _pair(names, phrases, words, other, number,
+                              max_distance)
+                if found is not None:
+                    seen.add((other, number))
+                    yield found
+
+            bucket.setdefault(drop, {}).setdefault(word, []).append(number)
+
+        if progress is not None and not (number + 1) % PROGRESS_EVERY:
+            progress(number + 1, len(seen))
+
+    # The last count, unless it was just reported
+    if progress is not None and (not phrases or len(phrases) % PROGRESS_EVERY):
+        progress(len(phrases), len(seen))
+
+
+def _deletions(word, count):
+    """`word` with up to `count` of its letters deleted, in every way"""
+    found = layer = {word}
+
+    for _ in range(count):
+        layer = {other[:drop] + other[drop + 1:]
+                 for other in layer for drop in range(len(other))}
+        found = found | layer
+
+    return found
+
+
+def _look_alikes(words, max_distance):
+    """
+    Function that returns the lowercase words that may be within
+    `max_distance` edits of a lowercase word: the ones sharing a deletion of
+    up to `max_distance` letters with it (a superset of them)
+    """
+    variants = {}
+    for word in {word.lower() for word in words}:
+        for variant in _deletions(word, max_distance):
+            variants.setdefault(variant, set()).add(word)
+
+    found = {}
+
+    def look_alikes(word):
+        if word not in found:
+            found[word] = set().union(*[
+                variants.get(variant, ()) for variant in
+                _deletions(word, max_distance)])
+        return found[word]
+
+    return look_alikes
+
+
+def _candidates(bucket, drop, word, look_alikes):
+    """
+    Generator of the fingerprints of a bucket to compare with a phrase that
+    has `word` at `drop` left out. Those with another word left out at the
+    same position differ only by it, so with `look_alikes` only the ones
+    whose word may be within the distance are compared: large buckets (of
+    phrases with a leading word of few bits) are not compared pair by pair
+    """
+    for position, groups in bucket.items():
+        if position != drop or position is None or look_alikes is None:
+            for numbers in groups.values():
+                yield from numbers
+            continue
+
+        for other in look_alikes(word):
+            yield from groups.get(other, ())
+
+
+# pylint: disable=too-many-arguments
+def _pair(names, phrases, words, first, second, max_distance):
+    """Pair of two fingerprints sharing a bucket, None if not reported"""
+    kind, position = _compare(phrases[first], phrases[second])
+
+    if kind != SUBSTITUTION:
+        return Pair(kind, names[first], names[second], position, None, None)
+
+    differing = (words[phrases[first][position]],
+                 words[phrases[second][position]])
+    dist = distance(*differing)
+
+    if max_distance is not None and dist > max_distance:
+        return None
+
+    return Pair(kind, names[first], names[second], position, differing, dist)
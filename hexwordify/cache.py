@@ -0,0 +1,140 @@
+"""
+Memoization of transformed hex strings. The same fingerprints tend to show up
+again and again, so their words are kept in a bounded LRU cache.
+"""
+import collections
+import weakref
+
+# id of each wordlist seen: (wordlist or a weak reference to it, digest)
+_WORDLIST_IDS = {}
+
+
+def _remember(table, wordlist, value):
+    """
+    Stores `value` in `table` under the id of `wordlist`, as
+    (wordlist, value). Wordlists that can be weakly referenced (compiled
+    ones, loaded again by the daemon when their file changes) take their
+    entry with them when they are freed. Tuples and lists are kept alive, so
+    their id is never reused.
+
+    return value: The stored value
+    """
+    key = id(wordlist)
+
+    try:
+        wordlist = weakref.ref(wordlist, lambda _: table.pop(key, None))
+    except TypeError:
+        pass
+
+    table[key] = (wordlist, value)
+    return value
+
+
+def wordlist_id(wordlist):
+    """
+    Stable identity of a wordlist, a digest of its words. The same words
+    loaded in another process (or from another file) have the same id.
+    """
+    try:
+        return _WORDLIST_IDS[id(wordlist)][1]
+    except KeyError:
+        # Imported here, it is slow to import and only caches need it
+        import hashlib
+
+        digest = hashlib.sha1("\n".join(
+            word.strip() for word in wordlist).encode()).hexdigest()[:16]
+        return _remember(_WORDLIST_IDS, wordlist, digest)
+
+
+def cache_key(string, wordlist, radix=False):
+    """
+    Cache key of a hex string: its digits (without colons or "0x", case
+    folded), whether it had a "0x" prefix (it changes the padding) and the
+    id of the wordlist. Binary values have the key of their hex string, they
+    give the same words. Mixed-radix words are kept under another id.
+    """
+    ident = wordlist_id(wordlist)
+    if radix:
+        ident = "radix:" + ident
+
+    if not isinstance(string, str):
+        return string.hex(), False, ident
+
+    digits = string.replace(":", "").lower()
+    prefixed = digits.startswith("0x")
+
+    if prefixed:
+        digits = digits[2:]
+
+    return digits, prefixed, ident
+
+
+class LRUCache:
+    """
+    Thread safe, size bounded cache with least recently used eviction.
+
+    maxsize: <int> Maximum number of entries
+
+    Example:
+        >>> cache = hexwordify.LRUCache(1024)
+        >>> hexwordify.finder("DEADBEEFDEADBEEF", cache=cache)
+            'assume fine wing wink pumpkin wash scale'
+        >>> cache.stats()
+            {'size': 1, 'maxsize': 1024, 'hits': 0, 'misses': 1,
+            'evictions': 0}
+    """
+    def __init__(self, maxsize=4096):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # Imported here, like hashlib
+        import threading
+
+        self._data = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Returns the cached value of `key` or None"""
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return None
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value, wordlist=None):
+        """
+        Caches `value` under `key`
+
+        wordlist: <tuple, list, CompiledWordlist> Wordlist of the key, not
+                  needed as the key identifies it
+        """
+        # pylint: disable=unused-argument
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """Drops every entry and resets the counters"""
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self):
+        """Returns the size and hit/miss/eviction counters as a dict"""
+        with self._lock:
+            return {"size": len(self._data), "maxsize": self.maxsize,
+                    "hits": self.hits, "misses": self.misses,
+                    "evictions": self.evictions}
+
+    def __len__(self):
+        return len(self._data)
@@ -0,0 +1,817 @@
+"""
+Console module
+"""
+import argparse
+import collections
+import io
+import json
+import os
+import sys
+from hexwordify import (DiskCache, LRUCache, analyze, gpg, ndjson, output,
+                        parallel_finder, scan, scan_file, stats, sub_file,
+                        wordlists, wrapper)
+from hexwordify.analyze import Pair
+from hexwordify.follow import follow
+from hexwordify.tree import read_files, walk
+from hexwordify.client import socket_path
+from hexwordify.daemon import serve
+from hexwordify.hexwordify import ENGINES, _default_finder
+from hexwordify.reverse import MIN_WORDS, _default_reverse_finder
+from hexwordify.stats import STATS, clock
+
+
+# LRU caches by size, they stay warm across daemon requests
+_CACHES = {}
+
+
+def _cache(size):
+    """Returns the shared LRU cache of the given size (None if 0)"""
+    if size <= 0:
+        return None
+
+    return _CACHES.setdefault(size, LRUCache(size))
+
+
+def _disk_cache(path, size):
+    """Returns the shared on-disk cache of the given file"""
+    # The daemon changes to the directory of each client
+    path = os.path.abspath(path)
+
+    if path not in _CACHES:
+        _CACHES[path] = DiskCache(path, size)
+
+    _CACHES[path].maxsize = size
+    return _CACHES[path]
+
+
+def text_finder(args):
+    """
+    Finder of the text output, with the options of `args`. It turns words
+    back to hex with --reverse
+    """
+    if args.reverse:
+        return _default_reverse_finder(args.min_words, not args.no_replace,
+                                       args.prepend, not args.no_color,
+                                       args.wordlist, args.radix)
+
+    return _default_finder(args.min_size, not args.no_replace, args.prepend,
+                           not args.no_color, args.wordlist, args.cache,
+                           args.engine, args.radix)
+
+
+def open_files(paths):
+    """Generator that opens each file in turn, closing the previous one"""
+    for path in paths:
+        with open(path) as fileo:
+            yield fileo
+
+
+def write(output, data):
+    """Writes and flushes, timing it as I/O"""
+    if STATS.enabled:
+        start = clock()
+        output.write(data)
+        output.flush()
+        STATS.time("io", clock() - start)
+    else:
+        output.write(data)
+        output.flush()
+
+
+def recursive_inputs(args):
+    """
+    Generator of (path, file object) of each text file under the paths of
+    `--file` (or the current directory), read ahead by a thread pool
+    """
+    paths = walk(args.file or ["."], args.include or (), args.exclude or (),
+                 args.exclude_dir or ())
+
+    for path, text in read_files(paths, args.threads):
+        # Binary or unreadable
+        if text is not None:
+            yield path, io.StringIO(text)
+
+
+def recursive(args, stdout):
+    """
+    Runs `finder` on the files of a directory tree, writing the lines with
+    hex strings prefixed by their file name, like grep
+    """
+    find = text_finder(args)
+
+    for path, fileo in recursive_inputs(args):
+        if STATS.enabled:
+            fileo = timed_lines(fileo)
+
+        result = []
+
+        for line in fileo:
+            pieces = []
+            last = 0
+
+            for match, words in find.finditer(line):
+                # Only the first one, like the rest of the -r output
+                if args.no_replace:
+                    result.append("%s:%s\n" % (path, words))
+                    break
+
+                pieces.append(line[last:match.start()])
+                pieces.append(words)
+                last = match.end()
+
+            if pieces:
+                pieces.append(line[last:])
+                result.append("%s:%s\n" % (path, "".join(pieces).strip()))
+
+        # A file at a time, in order
+        if result:
+            write(stdout, "".join(result))
+
+
+def write_results(output, results):
+    """
+    Writes the results one per line as they are produced, the same as
+    writing `"\\n".join(results).strip() + "\\n"`
+    """
+    # Empty results before the first and after the last line are stripped
+    started = False
+    empty = 0
+
+    for result in results:
+        if not result:
+            empty += started
+            continue
+
+        if started:
+            output.write("\n" * (empty + 1))
+
+        output.write(result)
+        started = True
+        empty = 0
+
+    write(output, "\n")
+
+
+# Whitespace `str.strip` strips, in ASCII
+WHITESPACE = b" \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f"
+
+
+class ResultWriter:
+    """
+    Binary counterpart of `write_results` for results written in pieces:
+    each result is stripped and they are written one per line, so memory
+    mapped files give the same output as files read to memory
+    """
+    def __init__(self, output):
+        self.output = output
+        self.started = False
+        self.empty = 0
+        # The result has something other than whitespace
+        self._open = False
+        # Whitespace that is trailing, unless more of the result follows
+        self._pending = b""
+
+    def write(self, data):
+        """Writes a piece of the current result"""
+        if not self._open:
+            data = data.lstrip(WHITESPACE)
+            if not data:
+                return
+
+            if self.started:
+                self.output.write(b"\n" * (self.empty + 1))
+
+            self.started = True
+            self.empty = 0
+            self._open = True
+
+        stripped = data.rstrip(WHITESPACE)
+
+        if stripped:
+            self.output.write(self._pending + stripped)
+            self._pending = data[len(stripped):]
+        else:
+            self._pending += data
+
+    def end(self):
+        """Ends the current result"""
+        if not self._open:
+            self.empty += self.started
+
+        self._open = False
+        self._pending = b""
+
+    def close(self):
+        """Ends the output, like `write_results`"""
+        self.output.write(b"\n")
+        self.output.flush()
+
+
+def mapped_files(args, stdout):
+    """
+    Runs `finder` on the files of --file through a memory map, writing the
+    same as when they are read to memory (-r keeps the first hex string of
+    each file)
+    """
+    stdout.flush()
+    writer = ResultWriter(stdout.buffer)
+
+    for filep in args.file:
+        if args.no_replace:
+            for _, _, string in scan_file(filep, args.min_size):
+                writer.write(wrapper(string, args.prepend, not args.no_color,
+                                     args.wordlist, args.cache).encode())
+                break
+        else:
+            sub_file(filep, writer, min_size=args.min_size, replace=True,
+                     prepend=args.prepend, color=not args.no_color,
+                     wordlist=args.wordlist, cache=args.cache)
+
+        writer.end()
+
+    writer.close()
+
+
+def timed_lines(fileo):
+    """Generator of the lines of a file, timing the reads as I/O"""
+    lines = iter(fileo)
+
+    while True:
+        start = clock()
+        line = next(lines, None)
+        STATS.time("io", clock() - start)
+
+        if line is None:
+            return
+
+        yield line
+
+
+def stream(fileo, output, args):
+    """
+    Runs `finder` on each line of `fileo` and writes the results to `output`
+    as soon as they are found. Memory usage is bounded by the longest line.
+    """
+    # The cached instance stays warm across daemon requests
+    find = text_finder(args)
+
+    if STATS.enabled:
+        fileo = timed_lines(fileo)
+
+    for line in find.lines(fileo):
+        write(output, line)
+
+
+def ndjson_records(args, stdin, stdout):
+    """
+    Rewrites the strings of each JSON record of the input (one per line),
+    writing the records back one at a time
+    """
+    # Escape codes would end up inside the JSON strings
+    args.no_color = True
+    find = text_finder(args)
+    inputs = open_files(args.file) if args.file else [stdin]
+
+    for fileo in inputs:
+        if STATS.enabled:
+            fileo = timed_lines(fileo)
+
+        for line in ndjson.rewrite(fileo, find, args.path):
+            if args.stream:
+                write(stdout, line)
+            else:
+                stdout.write(line)
+
+    stdout.flush()
+
+
+def structured(args, stdin, stdout):
+    """
+    Writes a record for each hex string found, in the format of
+    `args.format`. Hex string arguments are searched like lines, with their
+    number as the line number.
+    """
+    # Any hex string of the arguments, the same as the text output
+    if args.strings:
+        args.min_size = 1
+
+    # Records carry the bare words, color is for the text output only
+    find = _default_finder(args.min_size, True, False, False, args.wordlist,
+                           args.cache, args.engine, args.radix)
+    stdout.flush()
+
+    with output.WRITERS[args.format](stdout.buffer) as writer:
+        if args.strings:
+            for record in output.records(find, args.strings):
+                writer.write(record)
+            return
+
+        if args.mmap and args.file:
+            for filep in args.file:
+                for record in output.mapped_records(find, filep):
+                    writer.write(record)
+            return
+
+        if args.recursive:
+            inputs = recursive_inputs(args)
+        elif args.file is None:
+            inputs = [("-", stdin)]
+        else:
+            inputs = zip(args.file, open_files(args.file))
+
+        for source, fileo in inputs:
+            if STATS.enabled:
+                fileo = timed_lines(fileo)
+
+            for record in output.records(find, fileo, source):
+                writer.write(record)
+
+                # Never ending input has to show up as it is found
+                if args.stream:
+                    writer.flush()
+
+
+def follow_files(args, stdout):
+    """
+    Follows the files of `--file` like `tail -f`, writing the results of
+    the lines appended to them as they are found. Lines already read (per
+    the checkpoint) are not read again.
+    """
+    if args.format == "text":
+        find = text_finder(args)
+    else:
+        find = _default_finder(args.min_size, True, False, False,
+                               args.wordlist, args.cache, args.engine,
+                               args.radix)
+        stdout.flush()
+
+    # The name tells the results of many files apart, like tail
+    named = len(args.file) > 1
+    lines = follow(args.file, args.checkpoint, args.interval)
+
+    try:
+        if args.format == "text":
+            for path, _, line in lines:
+                result = find(line)
+
+                if args.no_replace and not result:
+                    continue
+
+                write(stdout, "%s:%s\n" % (path, result) if named
+                      else result + "\n")
+            return
+
+        with output.WRITERS[args.format](stdout.buffer) as writer:
+            for path, offset, line in lines:
+                for match, words in find.finditer(line):
+                    # Byte offset in the file
+                    start = offset + len(line[:match.start()].encode())
+                    writer.write(output.Record(path, None, start,
+                                               match.group(0), words.split()))
+
+                writer.flush()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        # Saves the checkpoint
+        lines.close()
+
+
+def gpg_keys(args, stdin, stdout):
+    """
+    Writes the keys of `gpg --with-colons` listings, one per line (or
+    record) with their key ID, user ID and the words of their fingerprint
+    """
+    start, end = ("", "") if args.no_color else ("\x1b[32;1m", "\x1b[0m")
+    stdout.flush()
+
+    if args.format == "text":
+        writer = output.TextWriter(stdout.buffer)
+    else:
+        writer = output.WRITERS[args.format](stdout.buffer,
+                                             fields=gpg.Key._fields)
+
+    if args.file is None:
+        inputs = [stdin]
+    else:
+        inputs = open_files(args.file)
+
+    with writer:
+        for fileo in inputs:
+            if STATS.enabled:
+                fileo = timed_lines(fileo)
+
+            for key in gpg.keys(fileo, args.wordlist, args.cache):
+                if args.format != "text":
+                    writer.write(key)
+                elif args.prepend:
+                    writer.write("%s %s %s: %s: %s%s%s\n" % (
+                        key.type, key.keyid, key.uid or "", key.fingerprint,
+                        start, " ".join(key.words), end))
+                else:
+                    writer.write("%s %s %s: %s%s%s\n" % (
+                        key.type, key.keyid, key.uid or "", start,
+                        " ".join(key.words), end))
+
+                if args.stream:
+                    writer.flush()
+
+
+def fingerprints(args, stdin):
+    """
+    Generator of the (name, hex string) of each fingerprint of the input:
+    every hex string found, or every key of --gpg listings
+    """
+    inputs = open_files(args.file) if args.file else [stdin]
+
+    for fileo in inputs:
+        if args.gpg:
+            for key in gpg.keys(fileo, args.wordlist):
+                if key.fingerprint:
+                    yield key.keyid, key.fingerprint
+            continue
+
+        for line in fileo:
+            for start, end in scan(line, args.min_size):
+                yield line[start:end], line[start:end]
+
+
+def analyze_command(argv, stdin, stdout):
+    """
+    Console function of `hexwordify analyze`
+    """
+    parse = argparse.ArgumentParser(
+        prog="hexwordify analyze",
+        description="Find fingerprints whose first words collide or nearly \
+                     collide (a word changed, added or removed)")
+    parse.add_argument("-k", "--words", type=int, default=4,
+                       help="Words of each phrase to compare \
+                            (default: %(default)s)")
+    parse.add_argument("-d", "--max-distance", type=int,
+                       help="Report changed words only if they are within \
+                            this many edits (look-alike words)")
+    parse.add_argument("-s", "--min-size", type=int, default=32,
+                       help="Minimum hex string size to search for in input \
+                            (default: %(default)s)")
+    parse.add_argument("-f", "--file", metavar="FILE", action="append",
+                       help="File to read")
+    parse.add_argument("-w", "--wordlist", default="bip39",
+                       help="Wordlist to use, a registered name (%s) or a \
+                            file with one word per line" %
+                       ", ".join(wordlists.available()))
+    parse.add_argument("--gpg", action="store_true",
+                       help="Read `gpg --with-colons` listings, pairs are \
+                            named by key ID")
+    parse.add_argument("--format", choices=output.FORMATS, default="text",
+                       help="Output format (default: %(default)s)")
+    parse.add_argument("--progress", action="store_true",
+                       help="Print the fingerprints analyzed to stderr")
+    args = parse.parse_args(argv)
+
+    try:
+        args.wordlist = wordlists.get(args.wordlist)
+    except (KeyError, ValueError) as err:
+        parse.error(err.args[0])
+
+    if args.words < 1 or args.min_size < 1:
+        parse.error("--words and --min-size have to be at least 1")
+
+    def progress(count, pairs):
+        """Reports the progress to stderr"""
+        sys.stderr.write("%d fingerprints, %d pairs\n" % (count, pairs))
+        sys.stderr.flush()
+
+    stdout.flush()
+
+    if args.format == "text":
+        writer = output.TextWriter(stdout.buffer)
+    else:
+        writer = output.WRITERS[args.format](stdout.buffer,
+                                             fields=Pair._fields)
+
+    with writer:
+        for pair in analyze(fingerprints(args, stdin), args.words,
+                            args.max_distance, args.wordlist,
+                            progress if args.progress else None):
+            if args.format != "text":
+                writer.write(pair)
+            elif pair.words:
+                writer.write("%s %s %s position %d: %s %s (%d)\n" % (
+                    pair.kind, pair.first, pair.second, pair.position,
+                    pair.words[0], pair.words[1], pair.distance))
+            elif pair.position is not None:
+                writer.write("%s %s %s position %d\n" % (
+                    pair.kind, pair.first, pair.second, pair.position))
+            else:
+                writer.write("%s %s %s\n" % (pair.kind, pair.first,
+                                              pair.second))
+
+
+def main(argv=None, stdin=None, stdout=None):
+    """
+    Main console function
+
+    argv: <list> Arguments, defaults to sys.argv[1:]
+    stdin: <file> Input, defaults to sys.stdin
+    stdout: <file> Output, defaults to sys.stdout
+    """
+    stdin = stdin or sys.stdin
+    stdout = stdout or sys.stdout
+    argv = sys.argv[1:] if argv is None else argv
+
+    if argv[:1] == ["analyze"]:
+        analyze_command(argv[1:], stdin, stdout)
+        return
+
+    parse = argparse.ArgumentParser(description=__doc__)
+    parse.add_argument("-c", "--no-color", action="store_true",
+                       help="Disable colored output")
+    parse.add_argument("-p", "--prepend", action="store_true",
+                       help="Prepend string given to output")
+    parse.add_argument("-r", "--no-replace", action="store_true",
+                       help="Ouput only found hex strings. Works like grep \
+                            (only used if no hex arguments are given)")
+    parse.add_argument("-s", "--min-size", type=int, default=32,
+                       help="Minimum hex string size to search for in input \
+                            (only used if no hex arguments are given)")
+    parse.add_argument("strings", metavar="hex_string", nargs="*",
+                       help="Hex strings to turn into words")
+    parse.add_argument("-f", "--file", metavar="FILE", action="append",
+                       help="File to read")
+    parse.add_argument("-R", "--recursive", action="store_true",
+                       help="Search the files under the directories given \
+                            with --file (or the current directory), writing \
+                            the lines with hex strings prefixed by the file \
+                            name. Binary files are skipped")
+    parse.add_argument("--include", metavar="GLOB", action="append",
+                       help="With -R, search only files whose name matches")
+    parse.add_argument("--exclude", metavar="GLOB", action="append",
+                       help="With -R, skip files whose name matches")
+    parse.add_argument("--exclude-dir", metavar="GLOB", action="append",
+                       help="With -R, skip directories whose name matches")
+    parse.add_argument("--threads", type=int, default=4,
+                       help="With -R, threads reading files ahead \
+                            (default: %(default)s)")
+    parse.add_argument("--follow", action="store_true",
+                       help="Follow the files given with --file like \
+                            `tail -f`, processing the lines appended to \
+                            them. Truncated and rotated files are read again \
+                            from the start")
+    parse.add_argument("--checkpoint", metavar="FILE",
+                       help="With --follow, keep the offset of each file in \
+                            FILE, so a restarted run resumes where the last \
+                            one stopped")
+    parse.add_argument("--interval", type=float, default=1.0,
+                       help="With --follow, seconds to wait for new lines \
+                            (default: %(default)s)")
+    parse.add_argument("-l", "--stream", action="store_true",
+                       help="Process input line by line, writing the results \
+                            as they are found (only used if no hex arguments \
+                            are given)")
+    parse.add_argument("-m", "--mmap", action="store_true",
+                       help="Scan files given with --file through a memory \
+                            map, without reading them to memory. The output \
+                            is the same, but line endings are written as \
+                            they are in the files (\\r\\n is not turned to \
+                            \\n)")
+    parse.add_argument("-w", "--wordlist", default="bip39",
+                       help="Wordlist to use, a registered name (%s) or a \
+                            file with one word per line" %
+                       ", ".join(wordlists.available()))
+    parse.add_argument("-j", "--jobs", type=int,
+                       help="Process input line by line with JOBS processes. \
+                            The output is the same as with --stream")
+    parse.add_argument("--gpg", action="store_true",
+                       help="Read `gpg --with-colons` listings and write the \
+                            key ID, user ID and the words of the fingerprint \
+                            of each key")
+    parse.add_argument("--format", choices=output.FORMATS, default="text",
+                       help="Output format. jsonl and tsv write a record for \
+                            each hex string found, with its file, line, \
+                            offset and words (default: %(default)s)")
+    parse.add_argument("--engine", choices=ENGINES, default="regex",
+                       help="How hex strings are found in the input, the \
+                            scanner is faster on long runs of hex \
+                            characters (default: %(default)s)")
+    parse.add_argument("--radix", action="store_true",
+                       help="Write the values in base len(wordlist) instead \
+                            of a power of 2 of bits per word, wordlists of \
+                            other lengths give fewer words")
+    parse.add_argument("--reverse", action="store_true",
+                       help="Turn runs of wordlist words back to the hex \
+                            strings they were made of")
+    parse.add_argument("--min-words", type=int, default=MIN_WORDS,
+                       help="With --reverse, minimum consecutive words to \
+                            search for in input (default: %(default)s)")
+    parse.add_argument("--ndjson", action="store_true",
+                       help="Read a JSON document per line and write it back \
+                            with the hex strings of its string values \
+                            replaced, one record at a time")
+    parse.add_argument("--path", metavar="PATH", action="append",
+                       help="With --ndjson, only rewrite the values under \
+                            PATH, dotted keys or list indices where * and ? \
+                            match like in file names (like keys.*.fpr). Can \
+                            be given many times")
+    parse.add_argument("--cache-size", type=int, default=4096,
+                       help="Number of transformed hex strings to remember, \
+                            0 to disable (default: %(default)s)")
+    parse.add_argument("--cache-file", metavar="FILE",
+                       help="Keep the transformed hex strings in an sqlite \
+                            database that can be shared by many runs and \
+                            processes, instead of in memory")
+    parse.add_argument("--cache-file-size", type=int, default=1 << 20,
+                       help="Number of entries kept in --cache-file \
+                            (default: %(default)s)")
+    parse.add_argument("--warmup", action="store_true",
+                       help="Only fill --cache-file with the hex strings of \
+                            the input, without writing any output")
+    parse.add_argument("--serve", action="store_true",
+                       help="Run as a daemon, serving hexwordify-client \
+                            requests on a unix socket")
+    parse.add_argument("--socket", default=socket_path(),
+                       help="Unix socket of the daemon (default: %(default)s)")
+    parse.add_argument("--stats", action="store_true",
+                       help="Print counters and the time spent in each phase \
+                            to stderr as JSON")
+    args = parse.parse_args(argv)
+
+    if args.format != "text" and args.jobs is not None:
+        parse.error("--format %s can't be used with --jobs" % args.format)
+
+    if args.gpg and (args.jobs is not None or args.strings):
+        parse.error("--gpg can't be used with --jobs or hex strings")
+
+    if args.recursive and (args.jobs is not None or args.mmap or args.gpg or
+                           args.warmup or args.strings):
+        parse.error("-R can't be used with --jobs, --mmap, --gpg, --warmup "
+                    "or hex strings")
+
+    if args.follow and (args.jobs is not None or args.recursive or
+                        args.mmap or args.gpg or args.warmup or args.strings):
+        parse.error("--follow can't be used with --jobs, -R, --mmap, --gpg, "
+                    "--warmup or hex strings")
+
+    if args.follow and not args.file:
+        parse.error("--follow needs files to follow, given with --file")
+
+    if args.interval <= 0:
+        parse.error("--interval has to be positive")
+
+    if args.radix and (args.jobs is not None or args.mmap or args.gpg or
+                       args.warmup):
+        parse.error("--radix can't be used with --jobs, --mmap, --gpg or "
+                    "--warmup")
+
+    if args.reverse and (args.jobs is not None or args.mmap or args.gpg or
+                         args.warmup or args.format != "text"):
+        parse.error("--reverse can't be used with --jobs, --mmap, --gpg, "
+                    "--warmup or --format %s" % args.format)
+
+    if args.ndjson and (args.jobs is not None or args.recursive or
+                        args.follow or args.mmap or args.gpg or args.warmup or
+                        args.no_replace or args.format != "text" or
+                        args.strings):
+        parse.error("--ndjson can't be used with --jobs, -R, --follow, "
+                    "--mmap, --gpg, --warmup, -r, --format jsonl/tsv or hex "
+                    "strings")
+
+    if args.path and not args.ndjson:
+        parse.error("--path can only be used with --ndjson")
+
+    if args.min_words < 1:
+        parse.error("--min-words has to be at least 1")
+
+    if args.threads < 1:
+        parse.error("--threads has to be at least 1")
+
+    if args.jobs is not None and args.jobs < 1:
+        parse.error("--jobs has to be at least 1")
+
+    try:
+        args.wordlist = wordlists.get(args.wordlist)
+    except (KeyError, ValueError) as err:
+        parse.error(err.args[0])
+
+    if args.cache_file:
+        args.cache = _disk_cache(args.cache_file, args.cache_file_size)
+    elif args.warmup:
+        parse.error("--warmup needs --cache-file")
+    else:
+        args.cache = _cache(args.cache_size)
+
+    if args.serve:
+        try:
+            serve(args.socket)
+        except FileExistsError as err:
+            parse.error(err.args[0])
+        return
+
+    if args.stats:
+        stats.enable()
+
+    try:
+        run(args, stdin, stdout)
+    finally:
+        # The on-disk cache outlives the run, write what it has pending
+        if args.cache_file:
+            args.cache.flush()
+
+        if args.stats:
+            summary = stats.emit()
+            if args.cache is not None:
+                summary["cache"] = args.cache.stats()
+            stats.disable()
+            sys.stderr.write(json.dumps(summary, sort_keys=True) + "\n")
+
+
+def run(args, stdin, stdout):
+    """
+    Runs the console function with parsed arguments
+    """
+    if args.warmup:
+        inputs = open_files(args.file) if args.file else [stdin]
+
+        for fileo in inputs:
+            if args.gpg:
+                # Only the fingerprints, transforming caches them
+                collections.deque(gpg.keys(fileo, args.wordlist, args.cache),
+                                  maxlen=0)
+            else:
+                args.cache.warmup(fileo, args.min_size, args.wordlist)
+        return
+
+    if args.follow:
+        follow_files(args, stdout)
+        return
+
+    if args.ndjson:
+        ndjson_records(args, stdin, stdout)
+        return
+
+    if args.gpg:
+        gpg_keys(args, stdin, stdout)
+        return
+
+    if args.format != "text":
+        structured(args, stdin, stdout)
+        return
+
+    if args.recursive:
+        recursive(args, stdout)
+        return
+
+    if args.mmap and args.file and not args.strings:
+        mapped_files(args, stdout)
+        return
+
+    if args.jobs is not None and not args.strings:
+        if args.file is None:
+            inputs = [stdin]
+        else:
+            inputs = open_files(args.file)
+
+        for result in parallel_finder(inputs, args.jobs, args.min_size,
+                                      not args.no_replace, args.prepend,
+                                      not args.no_color, args.wordlist,
+                                      cache_size=args.cache_size,
+                                      engine=args.engine):
+            write(stdout, result)
+
+        return
+
+    if args.stream and not args.strings:
+        if args.file is None:
+            stream(stdin, stdout, args)
+
+        for filep in args.file or []:
+            with open(filep) as fileo:
+                stream(fileo, stdout, args)
+
+        return
+
+    start = clock()
+
+    if not args.strings and args.file is None:
+        args.strings = stdin.read().split("\n")
+    elif args.strings and args.reverse:
+        # The shell splits a phrase to a word per argument
+        args.strings = [" ".join(args.strings)]
+    elif args.strings:
+        # Any hex string, not the empty matches of 0 characters too
+        args.min_size = 1
+
+    if args.file:
+        args.strings = []
+        for filep in args.file:
+            with open(filep) as fileo:
+                args.strings.append(fileo.read())
+
+    if STATS.enabled:
+        STATS.time("io", clock() - start)
+
+    find = text_finder(args)
+    write_results(stdout, (find(string) for string in args.strings))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""
+Tiny hexwordify client. Forwards the arguments to a running
+`hexwordify --serve` daemon, or runs in-process if there is none.
+
+The daemon asks for stdin only when it needs it and sends the output as it
+is produced, so streaming works the same as in-process.
+Set HEXWORDIFY_TIMING=1 to print the request latency to stderr.
+"""
+import json
+import os
+import socket
+import stat
+import struct
+import sys
+import time
+
+# Message: tag, payload length, payload
+MESSAGE = struct.Struct("!cI")
+SIZE = struct.Struct("!I")
+# Daemon to client
+INPUT = b"I"   # Wants up to <payload> bytes of stdin
+OUTPUT = b"O"  # Data for stdout
+ERROR = b"E"   # Data for stderr
+EXIT = b"X"    # Done, JSON with the exit status and the time it took
+# Client to daemon
+REQUEST = b"R"  # JSON with argv and cwd
+DATA = b"D"     # Data from stdin, empty on EOF
+
+
+def socket_path():
+    """Default unix socket of the daemon"""
+    if os.environ.get("HEXWORDIFY_SOCKET"):
+        return os.environ["HEXWORDIFY_SOCKET"]
+
+    if os.environ.get("XDG_RUNTIME_DIR"):
+        return os.path.join(os.environ["XDG_RUNTIME_DIR"], "hexwordify.sock")
+
+    return "/tmp/hexwordify-%d.sock" % os.getuid()
+
+
+def check_socket(path):
+    """
+    Raises PermissionError if `path` is not a socket of the current user.
+    Anyone can create the socket in /tmp first and answer with other words
+    """
+    info = os.stat(path)
+
+    if not stat.S_ISSOCK(info.st_mode) or info.st_uid != os.getuid():
+        raise PermissionError("%s is not a socket of the current user" %
+                              path)
+
+
+def send_message(sock, tag, data=b""):
+    """Sends a tagged, length prefixed message"""
+    sock.sendall(MESSAGE.pack(tag, len(data)) + data)
+
+
+def recv_message(sock):
+    """Receives a tagged message, returns (tag, payload)"""
+    tag, size = MESSAGE.unpack(_recv_exact(sock, MESSAGE.size))
+    return tag, _recv_exact(sock, size)
+
+
+def _recv_exact(sock, size):
+    """Receives exactly `size` bytes"""
+    data = bytearray()
+
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        if not chunk:
+            raise ConnectionError("Connection closed")
+        data += chunk
+
+    return bytes(data)
+
+
+def request(argv, stdin=None, stdout=None, stderr=None, path=None):
+    """
+    Runs a request on the daemon
+
+    argv: <list> Arguments, as given to hexwordify
+    stdin: <int> File descriptor of the input, defaults to 0
+    stdout: <binary file> Output, defaults to sys.stdout.buffer
+    stderr: <binary file> Errors, defaults to sys.stderr.buffer
+    path: <str> Unix socket of the daemon
+
+    return value: <tuple> (exit status, seconds spent in the daemon)
+    """
+    stdin = 0 if stdin is None else stdin
+    stdout = stdout or sys.stdout.buffer
+    stderr = stderr or sys.stderr.buffer
+
+    path = path or socket_path()
+    check_socket(path)
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(path)
+        send_message(sock, REQUEST, json.dumps({"argv": argv,
+                                                "cwd": os.getcwd()}).encode())
+
+        while True:
+            tag, data = recv_message(sock)
+
+            if tag == INPUT:
+                send_message(sock, DATA, os.read(stdin, SIZE.unpack(data)[0]))
+            elif tag == OUTPUT:
+                stdout.write(data)
+                stdout.flush()
+            elif tag == ERROR:
+                stderr.write(data)
+                stderr.flush()
+            elif tag == EXIT:
+                result = json.loads(data.decode())
+                return result["status"], result["elapsed"]
+
+
+def main():
+    """
+    Client console function
+    """
+    start = time.perf_counter()
+
+    try:
+        status, elapsed = request(sys.argv[1:])
+    except (FileNotFoundError, ConnectionRefusedError, PermissionError) as err:
+        if isinstance(err, PermissionError):
+            sys.stderr.write("hexwordify: not using the daemon, %s\n" % err)
+
+        # No daemon (or not one to trust), run in-process
+        from hexwordify.__main__ import main as local_main
+
+        return local_main(sys.argv[1:])
+
+    if os.environ.get("HEXWORDIFY_TIMING"):
+        sys.stderr.write("hexwordify: %.3fms total, %.3fms in daemon\n" %
+                         ((time.perf_counter() - start) * 1000,
+                          elapsed * 1000))
+
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,152 @@
+"""
+hexwordify daemon. Serves `hexwordify-client` requests on a unix socket,
+so the interpreter, the compiled patterns and the wordlists stay warm.
+Requests are handled one at a time, in the client's working directory.
+"""
+import contextlib
+import io
+import json
+import os
+import signal
+import socket
+import socketserver
+import stat
+import sys
+import time
+from .client import (DATA, ERROR, EXIT, INPUT, OUTPUT, REQUEST, SIZE,
+                     recv_message, send_message, socket_path)
+
+
+class SocketInput(io.RawIOBase):
+    """Reads the client's stdin, asking for it as needed"""
+
+    def __init__(self, sock):
+        super().__init__()
+        self.sock = sock
+        self.eof = False
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        if self.eof:
+            return 0
+
+        send_message(self.sock, INPUT, SIZE.pack(len(buffer)))
+        tag, data = recv_message(self.sock)
+
+        if tag != DATA:
+            raise ConnectionError("Unexpected message from client")
+
+        self.eof = not data
+        buffer[:len(data)] = data
+        return len(data)
+
+
+class SocketOutput(io.RawIOBase):
+    """Sends everything written to the client as `tag` messages"""
+
+    def __init__(self, sock, tag):
+        super().__init__()
+        self.sock = sock
+        self.tag = tag
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        send_message(self.sock, self.tag, bytes(data))
+        return len(data)
+
+
+class Handler(socketserver.BaseRequestHandler):
+    """Runs a single request through the console function"""
+
+    def handle(self):
+        # Imported here, hexwordify.cli imports this module
+        from .__main__ import main
+
+        try:
+            tag, data = recv_message(self.request)
+        except ConnectionError:
+            # Closed without a request, like the check of a new daemon
+            return
+
+        if tag != REQUEST:
+            return
+
+        header = json.loads(data.decode())
+        stdin = io.TextIOWrapper(io.BufferedReader(SocketInput(self.request)))
+        stdout = io.TextIOWrapper(
+            io.BufferedWriter(SocketOutput(self.request, OUTPUT)))
+        stderr = io.TextIOWrapper(
+            io.BufferedWriter(SocketOutput(self.request, ERROR)),
+            write_through=True)
+        status = 0
+
+        start = time.perf_counter()
+        cwd = os.getcwd()
+
+        try:
+            os.chdir(header["cwd"])
+            with contextlib.redirect_stderr(stderr):
+                main(header["argv"], stdin, stdout)
+        except SystemExit as err:
+            status = err.code if isinstance(err.code, int) \
+                else int(bool(err.code))
+        except Exception as err:  # pylint: disable=broad-except
+            stderr.write("hexwordify: %s\n" % err)
+            status = 1
+        finally:
+            os.chdir(cwd)
+
+        stdout.flush()
+        stderr.flush()
+        elapsed = time.perf_counter() - start
+        send_message(self.request, EXIT, json.dumps({
+            "status": status, "elapsed": elapsed}).encode())
+
+
+def _remove_stale(path):
+    """
+    Removes the socket of a daemon that is gone. Raises FileExistsError if
+    `path` is not a socket or a daemon still serves on it
+    """
+    if not stat.S_ISSOCK(os.lstat(path).st_mode):
+        raise FileExistsError("%s exists and is not a socket" % path)
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(path)
+        except ConnectionRefusedError:
+            os.unlink(path)
+            return
+
+    raise FileExistsError("A daemon is already serving on %s" % path)
+
+
+def serve(path=None):
+    """
+    Serves requests forever
+
+    path: <str> Unix socket to listen to
+    """
+    path = path or socket_path()
+
+    if os.path.lexists(path):
+        _remove_stale(path)
+
+    umask = os.umask(0o077)
+    try:
+        server = socketserver.UnixStreamServer(path, Handler)
+    finally:
+        os.umask(umask)
+
+    # Clean up the socket on kill too
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        os.unlink(path)
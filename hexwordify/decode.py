@@ -0,0 +1,303 @@
+"""
+Turn words back to hexadecimal strings. Words are looked up by exact match,
+by unique prefix (bip-0039 words are unique in their first 4 letters) and,
+for typos, by edit distance.
+"""
+from .bip_0039 import WORDLIST
+from .cache import _remember
+from .hexwordify import _word_bits
+from .radix import from_digits
+
+
+def distance(first, second):
+    """
+    Levenshtein distance of two strings
+
+    Example:
+        >>> hexwordify.distance("abandon", "abandno")
+            2
+    """
+    if len(first) < len(second):
+        first, second = second, first
+
+    previous = list(range(len(second) + 1))
+
+    for i, char in enumerate(first, 1):
+        current = [i]
+
+        for j, other in enumerate(second, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1,
+                               previous[j - 1] + (char != other)))
+
+        previous = current
+
+    return previous[-1]
+
+
+class WordIndex:
+    """
+    Precomputed lookups over a wordlist:
+    - a dict for exact matches
+    - a flattened trie, mapping each prefix shared by only one word to it
+    - a BK-tree for matches within an edit distance
+
+    wordlist: <tuple, list, CompiledWordlist> Tuple containing words
+    """
+    def __init__(self, wordlist=WORDLIST):
+        self.bits = _word_bits(wordlist)
+        self.exact = {}
+        self.prefixes = {}
+        self.tree = None
+
+        owners = {}
+        for index, word in enumerate(wordlist):
+            word = word.strip().lower()
+            self.exact.setdefault(word, index)
+
+            for end in range(1, len(word)):
+                owners.setdefault(word[:end], set()).add(index)
+
+        self.prefixes = {prefix: indices.pop()
+                         for prefix, indices in owners.items()
+                         if len(indices) == 1}
+
+    def _build_tree(self):
+        """Builds the BK-tree, a node is (word, index, {distance: node})"""
+        words = iter(self.exact.items())
+        word, index = next(words)
+        self.tree = (word, index, {})
+
+        for word, index in words:
+            node = self.tree
+
+            while True:
+                dist = distance(word, node[0])
+                if dist not in node[2]:
+                    node[2][dist] = (word, index, {})
+                    break
+                node = node[2][dist]
+
+    def nearest(self, word, max_distance=1):
+        """
+        Finds the words within `max_distance` edits of `word`
+
+        return value: <list> (distance, index) pairs sorted by distance
+        """
+        if not self.exact:
+            return []
+
+        if self.tree is None:
+            self._build_tree()
+
+        found = []
+        nodes = [self.tree]
+
+        while nodes:
+            other, index, children = nodes.pop()
+            dist = distance(word, other)
+
+            if dist <= max_distance:
+                found.append((dist, index))
+
+            for child_dist, child in children.items():
+                if dist - max_distance <= child_dist <= dist + max_distance:
+                    nodes.append(child)
+
+        return sorted(found)
+
+    def lookup(self, word, max_distance=1):
+        """
+        Returns the index of `word` in the wordlist, trying an exact match,
+        then a unique prefix and then the single closest word within
+        `max_distance` edits.
+
+        Raises ValueError if no word (or more than one) matches
+        """
+        word = word.strip().lower()
+
+        try:
+            return self.exact[word]
+        except KeyError:
+            pass
+
+        try:
+            return self.prefixes[word]
+        except KeyError:
+            pass
+
+        if max_distance > 0:
+            found = self.nearest(word, max_distance)
+
+            if len(found) == 1 or (found and found[0][0] < found[1][0]):
+                return found[0][1]
+
+        raise ValueError("Unknown word '%s'" % word)
+
+
+# id of each wordlist seen: (wordlist or a weak reference to it, WordIndex)
+_INDEXES = {}
+
+
+def word_index(wordlist=WORDLIST):
+    """Returns the cached WordIndex of a wordlist"""
+    try:
+        return _INDEXES[id(wordlist)][1]
+    except KeyError:
+        return _remember(_INDEXES, wordlist, WordIndex(wordlist))
+
+
+def _word_count(length, bits):
+    """Number of words `transform` gives for `length` hex digits"""
+    return -(-(length * 4 + (length * 4) % bits) // bits)
+
+
+# Candidate lengths by (word count, bits), see `_lengths`
+_LENGTHS = {}
+
+
+def _lengths(count, bits):
+    """
+    (length, padding bits) of the hex strings that can give `count` words,
+    most likely first. Hex strings are whole bytes (like any digest), so
+    even lengths come first. Then lengths that need the most zero padding
+    bits are the least likely to match by chance. A leading word of few bits
+    is often zero and dropped, so lengths of one more word are candidates
+    too, less likely by the bits of that word.
+    """
+    try:
+        return _LENGTHS[count, bits]
+    except KeyError:
+        pass
+
+    candidates = []
+    # The padding adds up to a word, on top of the words of the digits
+    shortest = max(1, (count - 2) * bits // 4)
+
+    for length in range(shortest, (count + 1) * bits // 4 + 1):
+        pad = (length * 4) % bits
+        words = _word_count(length, bits)
+
+        if words not in (count, count + 1):
+            continue
+
+        score = pad
+        if words > count:
+            # Bits of the dropped word
+            score -= length * 4 + pad - count * bits
+
+        candidates.append((length % 2 == 0, score, pad, length))
+
+    _LENGTHS[count, bits] = [(length, pad) for _, _, pad, length
+                             in sorted(candidates, reverse=True)]
+    return _LENGTHS[count, bits]
+
+
+def _guess_length(value, count, bits):
+    """
+    Guesses the hex digits that gave `count` words: the most likely length
+    whose padding bits are zero and that `value` fits in
+    """
+    size = value.bit_length()
+    # Trailing zero bits
+    zeros = (value & -value).bit_length() - 1 if value else size + bits
+
+    for length, pad in _lengths(count, bits):
+        if pad <= zeros and size <= length * 4 + pad:
+            return length
+
+    raise ValueError("Can't guess the hex length, give it explicitly")
+
+
+def _indices_to_hex(indices, bits, length=None):
+    """Inverse of the `transform` bit layout"""
+    value = 0
+    for index in indices:
+        value = (value << bits) | index
+
+    if length is None:
+        length = _guess_length(value, len(indices), bits)
+
+    pad = (length * 4) % bits
+
+    if value % 2**pad or value >> (length * 4 + pad):
+        raise ValueError("Words don't fit in %d hex digits" % length)
+
+    return "%0*x" % (length, value >> pad) if length else ""
+
+
+def _radix_to_hex(indices, base, length=None):
+    """Inverse of the mixed-radix encoding"""
+    value = from_digits(indices, base)
+    digits = "%x" % value if value else ""
+
+    # Whole bytes, the length of most hex strings (and of any digest)
+    if length is None:
+        length = len(digits) + len(digits) % 2
+
+    if len(digits) > length:
+        raise ValueError("Words don't fit in %d hex digits" % length)
+
+    return digits.zfill(length)
+
+
+# The list is not altered, so its not a dangerous default value anymore:
+# pylint: disable=dangerous-default-value
+def decode(words, wordlist=WORDLIST, length=None, max_distance=1,
+           radix=False):
+    """
+    Turns words back to the hex string they were made of. Inverse of
+    `transform`.
+
+    words: <str, list, tuple> Words (or space delimited string of words)
+           Unique prefixes and typos are accepted
+    wordlist: <tuple, list, CompiledWordlist> Tuple containing words
+    length: <int> Hex digits of the result. `transform` drops leading zero
+            words, so without it the length is a (good) guess, of whole
+            bytes. Strings with leading zero digits may need it
+    max_distance: <int> Maximum edit distance when correcting typos
+    radix: <bool> The words are mixed-radix encoded (see `transform`).
+           Without `length` the result is the shortest whole bytes
+
+    return value: <str> Lowercase hex string
+
+    Example:
+        >>> hexwordify.decode("dash fork upon length")
+            'deadbeef'
+        >>> hexwordify.decode("dash fork upon lenqth", length=8)
+            'deadbeef'
+        >>> hexwordify.decode("hungry report target", radix=True)
+            'deadbeef'
+    """
+    return decode_many([words], wordlist, length, max_distance, radix)[0]
+
+
+def decode_many(phrases, wordlist=WORDLIST, length=None, max_distance=1,
+                radix=False):
+    """
+    Same as `decode` for many phrases, using the same index
+
+    phrases: <iterable> Words (or space delimited strings of words)
+
+    return value: <list> Lowercase hex string for each phrase
+    """
+    index = word_index(wordlist)
+
+    if not index.bits:
+        raise ValueError("Wordlist needs at least 2 words")
+
+    result = []
+    for words in phrases:
+        if isinstance(words, str):
+            words = words.split()
+
+        if not isinstance(words, (list, tuple)):
+            raise TypeError("Words have to be str, list or tuple")
+
+        indices = [index.lookup(word, max_distance) for word in words]
+
+        if radix:
+            result.append(_radix_to_hex(indices, len(wordlist), length))
+        else:
+            result.append(_indices_to_hex(indices, index.bits, length))
+
+    return result
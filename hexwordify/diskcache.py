@@ -0,0 +1,207 @@
+"""
+Persistent cache of transformed hex strings, in an sqlite database. The keys
+are the normalized hex string and the wordlist id (a digest of its words), so
+results are shared between runs, processes and hosts that use the same
+database. It has the same methods as LRUCache and works wherever a cache is
+accepted.
+
+Example:
+    >>> with hexwordify.DiskCache("/var/cache/ci/hexwordify.sqlite") as cache:
+    ...     hexwordify.finder(listing, cache=cache)
+"""
+import os
+import threading
+from .bip_0039 import WORDLIST
+from .hexwordify import Finder
+from .wordlists import cache_dir
+
+# Writes are kept in memory and written in batches: a transaction per write
+# would be bound by fsync, and the database is locked only while writing
+BATCH_SIZE = 8192
+# Seconds to wait for another process holding the database lock
+TIMEOUT = 30
+MMAP_SIZE = 1 << 28
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS words (
+    digits TEXT NOT NULL,
+    prefixed INTEGER NOT NULL,
+    wordlist TEXT NOT NULL,
+    words TEXT NOT NULL,
+    PRIMARY KEY (digits, prefixed, wordlist)
+)
+"""
+
+
+def default_path():
+    """Default database, in the same directory as the compiled wordlists"""
+    return os.path.join(cache_dir(), "words.sqlite")
+
+
+class DiskCache:
+    """
+    Size bounded cache in an sqlite database, safe to use from many threads
+    and processes at once. When it grows past `maxsize` the oldest entries
+    are evicted.
+
+    path: <str> Database file, created if missing
+    maxsize: <int> Maximum number of entries
+
+    Example:
+        >>> cache = hexwordify.DiskCache("words.sqlite")
+        >>> hexwordify.finder("DEADBEEFDEADBEEF", cache=cache)
+            'assume fine wing wink pumpkin wash scale'
+        >>> cache.close()
+    """
+    def __init__(self, path=None, maxsize=1 << 20):
+        self.path = path or default_path()
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._pending = {}
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+
+        # Imported here, only --cache-file needs it
+        import sqlite3
+
+        # One connection for every thread, access is serialized by the lock
+        self._db = sqlite3.connect(self.path, timeout=TIMEOUT,
+                                   check_same_thread=False)
+        # Readers don't block the writer (and the other way around)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        # Lookups read the mapped file instead of copying pages
+        self._db.execute("PRAGMA mmap_size=%d" % MMAP_SIZE)
+        self._db.execute(SCHEMA)
+        self._db.commit()
+        # Approximate, other processes write too. It is counted again
+        # before evicting
+        self._count = self._size()
+
+    def get(self, key):
+        """Returns the cached value of `key` or None"""
+        with self._lock:
+            value = self._pending.get(key)
+            if value is not None:
+                self.hits += 1
+                return value
+
+            row = self._db.execute(
+                "SELECT words FROM words "
+                "WHERE digits = ? AND prefixed = ? AND wordlist = ?",
+                key).fetchone()
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            return row[0]
+
+    def put(self, key, value, wordlist=None):
+        """
+        Caches `value` under `key`. Writes are committed in batches, and by
+        `flush` and `close`
+
+        wordlist: <tuple, list, CompiledWordlist> Wordlist of the key, not
+                  needed as the key identifies it
+        """
+        # pylint: disable=unused-argument
+        with self._lock:
+            self._pending[key] = value
+
+            if len(self._pending) >= BATCH_SIZE:
+                self._commit()
+
+    def _commit(self):
+        """Writes the pending entries and evicts the oldest ones"""
+        if not self._pending:
+            return
+
+        # Another process may have written the same entries
+        changes = self._db.total_changes
+        self._db.executemany("INSERT OR IGNORE INTO words VALUES (?, ?, ?, ?)",
+                             [key + (value,)
+                              for key, value in self._pending.items()])
+        self._count += self._db.total_changes - changes
+        self._pending.clear()
+
+        if self._count > self.maxsize:
+            self._count = self._db.execute("SELECT count(*) FROM words") \
+                .fetchone()[0]
+            excess = self._count - self.maxsize
+
+            # Rows are appended, the smallest rowids are the oldest
+            if excess > 0:
+                self._db.execute("DELETE FROM words WHERE rowid IN "
+                                 "(SELECT rowid FROM words ORDER BY rowid "
+                                 "LIMIT ?)", (excess,))
+                self.evictions += excess
+                self._count = self.maxsize
+
+        self._db.commit()
+
+    def flush(self):
+        """Commits the pending writes"""
+        with self._lock:
+            self._commit()
+
+    def warmup(self, lines, min_size=16, wordlist=WORDLIST):
+        """
+        Transforms and caches every hex string found in `lines`
+
+        lines: <iterable> Lines to search (a file object works)
+        min_size: <int> Minimum consecutive characters that have to be found
+                        to be considered a hex string
+
+        return value: <int> Number of hex strings found
+        """
+        find = Finder(min_size, wordlist=wordlist, cache=self)
+        found = 0
+
+        for line in lines:
+            found += len(find.findall(line))
+
+        self.flush()
+        return found
+
+    def clear(self):
+        """Drops every entry and resets the counters"""
+        with self._lock:
+            self._db.execute("DELETE FROM words")
+            self._db.commit()
+            self._pending.clear()
+            self._count = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self):
+        """Returns the size and hit/miss/eviction counters as a dict"""
+        with self._lock:
+            return {"size": self._size(), "maxsize": self.maxsize,
+                    "hits": self.hits, "misses": self.misses,
+                    "evictions": self.evictions}
+
+    def _size(self):
+        """Number of entries, written or not"""
+        written = self._db.execute("SELECT count(*) FROM words").fetchone()[0]
+        return written + len(self._pending)
+
+    def close(self):
+        """Commits the pending writes and closes the database"""
+        with self._lock:
+            self._commit()
+            self._db.close()
+
+    def __len__(self):
+        with self._lock:
+            return self._size()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,131 @@
+"""
+Memory mapped file scanning. The hex regex runs directly over the mapped
+file, one window at a time, so huge files are never read to memory.
+Only the matched hex strings are decoded.
+"""
+import mmap
+import re
+from .bip_0039 import WORDLIST
+from .hexwordify import wrapper
+from .stats import STATS, clock
+
+# Bytes that can be part of a hex string (or its "0x" prefix)
+HEXISH = b"0123456789abcdefABCDEF:xX"
+WINDOW_SIZE = 1 << 20
+
+
+def _run_end(mapped, pos, window):
+    """
+    Returns the first position from `pos` onwards that can not be part of a
+    hex string (or the size of the file)
+    """
+    while pos < len(mapped):
+        chunk = mapped[pos:pos + window]
+        rest = chunk.lstrip(HEXISH)
+
+        if rest:
+            return pos + len(chunk) - len(rest)
+
+        pos += len(chunk)
+
+    return pos
+
+
+def scan_mapped(mapped, min_size=16, window=WINDOW_SIZE):
+    """
+    Generator that finds hex strings in a bytes-like object (an mmap).
+
+    mapped: <mmap, bytes> Buffer to scan
+    min_size: <int> Minimum consecutive characters that have to be found to be
+                    considered a hex string
+    window: <int> Bytes scanned at a time. Windows are extended so that no
+            hex string is cut in half
+
+    return value: <generator> Yields (start, end, hex string) for each match
+    """
+    regex = re.compile(rb"(?:0x)?[0-9a-f:]{%d,}" % min_size, re.I | re.M)
+    start = 0
+
+    while start < len(mapped):
+        # The window always stops on a byte that can't be in a hex string,
+        # so every match in it is complete
+        end = _run_end(mapped, min(start + window, len(mapped)), window)
+
+        for match in regex.finditer(mapped, start, end):
+            yield match.start(), match.end(), match.group(0).decode("ascii")
+
+        start = end
+
+
+def scan_file(path, min_size=16, window=WINDOW_SIZE):
+    """
+    Generator that finds hex strings in a file through a memory map.
+
+    path: <str> File to scan
+    min_size: <int> Minimum consecutive characters that have to be found to be
+                    considered a hex string
+    window: <int> Bytes scanned at a time
+
+    return value: <generator> Yields (start, end, hex string) for each match
+
+    Example:
+        >>> list(hexwordify.scan_file("keys.txt", 32))
+            [(6, 46, '1814E2AFF5E59A004BA2109EBEA53D73528636D3')]
+    """
+    with open(path, "rb") as fileo:
+        # Empty files can't be mapped
+        if not fileo.seek(0, 2):
+            return
+
+        with mmap.mmap(fileo.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield from scan_mapped(mapped, min_size, window)
+
+
+def _write_range(output, mapped, start, end, window):
+    """Writes mapped[start:end] to output, a window at a time"""
+    for pos in range(start, end, window):
+        output.write(mapped[pos:min(pos + window, end)])
+
+
+# pylint: disable=too-many-arguments,dangerous-default-value
+def sub_file(path, output, min_size=16, replace=True, prepend=False,
+             color=False, window=WINDOW_SIZE, wordlist=WORDLIST, cache=None):
+    """
+    Same as `finder` on the contents of a file, but the file is memory mapped
+    and the result is written to `output` as it is produced.
+
+    path: <str> File to scan
+    output: <binary file> Where the result is written
+    replace: <bool> Replace the found strings with the resulting words and
+             write the rest of the file as is. Otherwise write only the
+             resulting words, one match per line
+    window: <int> Bytes scanned at a time
+
+    See `finder` for the rest of the arguments
+    """
+    with open(path, "rb") as fileo:
+        if not fileo.seek(0, 2):
+            return
+
+        with mmap.mmap(fileo.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            start = clock()
+            last = 0
+
+            for begin, end, string in scan_mapped(mapped, min_size, window):
+                result = wrapper(string, prepend, color, wordlist,
+                                 cache).encode()
+
+                if replace:
+                    _write_range(output, mapped, last, begin, window)
+                    output.write(result)
+                else:
+                    output.write(result + b"\n")
+
+                last = end
+
+            if replace:
+                _write_range(output, mapped, last, len(mapped), window)
+
+            if STATS.enabled:
+                STATS.time("scan", clock() - start)
+                STATS.count("bytes_scanned", len(mapped))
@@ -0,0 +1,188 @@
+"""
+`tail -f` for growing files. Each file is read from the byte offset where the
+last read stopped, only complete lines are returned. Truncated files are read
+again from the start, and rotated files (a new inode at the same path) are
+read to their end before the new file is opened. The offsets can be saved to
+a checkpoint file, so a restarted follower resumes where it stopped.
+
+Example:
+    >>> for path, offset, line in hexwordify.follow(["/var/log/auth.log"],
+    ...                                             "auth.checkpoint"):
+    ...     print(hexwordify.finder(line))
+"""
+import json
+import os
+import time
+
+CHUNK_SIZE = 1 << 16
+# Seconds between polls when no file has new lines
+INTERVAL = 1.0
+# Seconds between checkpoint saves while lines keep coming
+SAVE_INTERVAL = 5.0
+
+
+class Follower:
+    """
+    Offsets of followed files
+
+    paths: <iterable> Files to follow, they may not exist yet
+    checkpoint: <str> JSON file the offsets are loaded from and saved to
+    """
+    def __init__(self, paths, checkpoint=None):
+        self.paths = list(paths)
+        self.checkpoint = checkpoint
+        # path: (device, inode, offset) of the next line to read
+        self.offsets = {}
+        self._files = {}
+
+        if checkpoint is not None and os.path.exists(checkpoint):
+            with open(checkpoint) as fileo:
+                for path, state in json.load(fileo).items():
+                    self.offsets[path] = (state["device"], state["inode"],
+                                          state["offset"])
+
+    def _open(self, path):
+        """
+        Opens a file at its saved offset, or at the start if it is not the
+        same file (inode) or it is shorter than the offset
+        """
+        try:
+            fileo = open(path, "rb")
+        except FileNotFoundError:
+            return None
+
+        status = os.fstat(fileo.fileno())
+        identity = (status.st_dev, status.st_ino)
+        device, inode, offset = self.offsets.get(path, (None, None, 0))
+
+        if (device, inode) != identity or offset > status.st_size:
+            offset = 0
+
+        self.offsets[path] = identity + (offset,)
+        self._files[path] = fileo
+        return fileo
+
+    def _read(self, path, fileo):
+        """
+        Generator of the complete lines appended since the last read, the
+        offset is moved past each line once the consumer is done with it
+        """
+        device, inode, offset = self.offsets[path]
+        fileo.seek(offset)
+        partial = b""
+
+        while True:
+            data = fileo.read(CHUNK_SIZE)
+            if not data:
+                return
+
+            partial += data
+            start = 0
+
+            while True:
+                end = partial.find(b"\n", start) + 1
+                if not end:
+                    break
+
+                yield path, offset, partial[start:end].decode(errors="replace")
+                offset += end - start
+                self.offsets[path] = (device, inode, offset)
+                start = end
+
+            partial = partial[start:]
+
+    def poll(self):
+        """
+        Generator of the lines appended to the files since the last poll
+
+        return value: <generator> Yields (path, byte offset, line) for each
+                      complete line, with its newline
+        """
+        for path in self.paths:
+            fileo = self._files.get(path) or self._open(path)
+            if fileo is None:
+                continue
+
+            current = os.fstat(fileo.fileno())
+
+            # Truncated, start over
+            if current.st_size < self.offsets[path][2]:
+                self.offsets[path] = self.offsets[path][:2] + (0,)
+
+            yield from self._read(path, fileo)
+
+            try:
+                status = os.stat(path)
+            except FileNotFoundError:
+                status = None
+
+            # Rotated, the old file was read to its end
+            if status is None or (status.st_dev, status.st_ino) != \
+                    (current.st_dev, current.st_ino):
+                fileo.close()
+                del self._files[path]
+
+                fileo = self._open(path)
+                if fileo is not None:
+                    yield from self._read(path, fileo)
+
+    def save(self):
+        """Saves the offsets to the checkpoint file, atomically"""
+        if self.checkpoint is None:
+            return
+
+        state = {path: {"device": device, "inode": inode, "offset": offset}
+                 for path, (device, inode, offset) in self.offsets.items()}
+        temporary = self.checkpoint + ".tmp"
+
+        with open(temporary, "w") as fileo:
+            json.dump(state, fileo, sort_keys=True)
+
+        os.replace(temporary, self.checkpoint)
+
+    def close(self):
+        """Saves the offsets and closes the files"""
+        self.save()
+
+        for fileo in self._files.values():
+            fileo.close()
+
+        self._files.clear()
+
+
+def follow(paths, checkpoint=None, interval=INTERVAL):
+    """
+    Generator that follows files forever, like `tail -f`. Lines are read
+    from the checkpointed offsets (or the start of the files) on. The
+    checkpoint is saved every few seconds and when the generator is closed,
+    only with the lines the consumer is done with.
+
+    paths: <iterable> Files to follow, they may not exist yet
+    checkpoint: <str> JSON file to keep the offsets in
+    interval: <float> Seconds to wait when there are no new lines
+
+    return value: <generator> Yields (path, byte offset, line) for each
+                  complete line, with its newline
+    """
+    follower = Follower(paths, checkpoint)
+    saved = time.monotonic()
+
+    try:
+        while True:
+            found = False
+
+            for item in follower.poll():
+                found = True
+                yield item
+
+                if time.monotonic() - saved > SAVE_INTERVAL:
+                    follower.save()
+                    saved = time.monotonic()
+
+            if found:
+                follower.save()
+                saved = time.monotonic()
+            else:
+                time.sleep(interval)
+    finally:
+        follower.close()
@@ -0,0 +1,144 @@
+"""
+GPG keyring listings. Parses the `gpg --with-colons` format as a stream and
+transforms only the fingerprints (`fpr` records), so no other hex is ever
+mistaken for one. A key is kept only until its user IDs are read, memory
+does not grow with the size of the keyring.
+
+Example:
+    >>> listing = subprocess.Popen(["gpg", "--with-colons", "-k"],
+    ...                            stdout=subprocess.PIPE, text=True)
+    >>> for key in hexwordify.gpg.keys(listing.stdout):
+    ...     print(key.keyid, key.uid, " ".join(key.words))
+"""
+import collections
+import re
+from .bip_0039 import WORDLIST
+from .hexwordify import _default_finder
+
+# Record types of primary keys and subkeys (public and secret)
+PRIMARY = ("pub", "sec")
+SUBKEY = ("sub", "ssb")
+RECORDS = PRIMARY + SUBKEY + ("fpr", "uid")
+
+# Field positions, see doc/DETAILS in the GnuPG sources
+FIELD_VALIDITY = 1
+FIELD_KEYID = 4
+FIELD_USERID = 9
+
+# Characters escaped in user IDs, like ":" as "\x3a"
+ESCAPE = re.compile(r"\\x([0-9a-fA-F]{2})")
+
+Key = collections.namedtuple("Key",
+                             ("type", "keyid", "uid", "fingerprint", "words"))
+
+
+def unescape(field):
+    """Decodes the C-style escapes of a --with-colons field"""
+    if "\\" not in field:
+        return field
+
+    return ESCAPE.sub(lambda match: chr(int(match.group(1), 16)), field)
+
+
+class _Pending:
+    """A key read up to now, until it can be yielded"""
+    __slots__ = ("type", "keyid", "uid", "revoked_uid", "fingerprint")
+
+    def __init__(self, kind, keyid, uid=None):
+        self.type = kind
+        self.keyid = keyid
+        self.uid = uid
+        self.revoked_uid = None
+        self.fingerprint = None
+
+    def user_id(self):
+        """The first valid user ID, or the first revoked or expired one"""
+        return self.uid if self.uid is not None else self.revoked_uid
+
+
+# The list is not altered, so its not a dangerous default value anymore:
+# pylint: disable=dangerous-default-value
+def keys(lines, wordlist=WORDLIST, cache=None):
+    """
+    Generator of the keys of a `gpg --with-colons` listing, subkeys
+    included. Every key has the (first valid) user ID of its primary key.
+
+    lines: <iterable> Lines of the listing (a file object works)
+    wordlist: <tuple, list, CompiledWordlist> Tuple containing words
+    cache: <LRUCache> Cache of the resulting words
+
+    return value: <generator> Yields a Key for each key, with the words of
+                  its fingerprint (empty if the listing has none)
+    """
+    # Only used to transform, with the words (and cache) set up once
+    find = _default_finder(0, True, False, False, wordlist, cache)
+
+    def finish(key):
+        """Key of a pending key"""
+        if key.fingerprint is None:
+            words = []
+        else:
+            words = find.render(key.fingerprint).split()
+
+        return Key(key.type, key.keyid, key.user_id(), key.fingerprint, words)
+
+    # The primary key is yielded once its user IDs are read, which is at
+    # its first subkey, the next primary key or the end of the listing
+    primary = None
+    # Key waiting for its fingerprint
+    current = None
+    owner = None
+
+    for line in lines:
+        kind = line[:3]
+        if kind not in RECORDS or line[3:4] != ":":
+            continue
+
+        fields = line.rstrip("\r\n").split(":")
+
+        # Truncated records
+        if len(fields) <= (FIELD_USERID if kind == "fpr" else FIELD_KEYID):
+            continue
+
+        # The pending subkey had no fpr record
+        if kind in PRIMARY + SUBKEY and current is not None and \
+                current is not primary:
+            yield finish(current)
+
+        if kind in PRIMARY:
+            if primary is not None:
+                yield finish(primary)
+
+            primary = current = _Pending(kind, fields[FIELD_KEYID])
+        elif kind in SUBKEY:
+            if primary is not None:
+                owner = primary.user_id()
+                yield finish(primary)
+                primary = None
+
+            current = _Pending(kind, fields[FIELD_KEYID], owner)
+        elif kind == "fpr":
+            if current is None:
+                continue
+
+            current.fingerprint = fields[FIELD_USERID]
+
+            # Subkeys have all they need
+            if current is not primary:
+                yield finish(current)
+
+            current = None
+        elif primary is not None and len(fields) > FIELD_USERID:
+            uid = unescape(fields[FIELD_USERID])
+
+            if fields[FIELD_VALIDITY] in ("r", "e"):
+                if primary.revoked_uid is None:
+                    primary.revoked_uid = uid
+            elif primary.uid is None:
+                primary.uid = uid
+
+    if current is not None and current is not primary:
+        yield finish(current)
+
+    if primary is not None:
+        yield finish(primary)
@@ -7,66 +7,371 @@ regex search for hex strings longer than `min_size` characters.
 Example: gpg -k | hexwordify.py
 """
 import math
-import re
 try:
     from .bip_0039 import WORDLIST
+    from .cache import cache_key
+    from .radix import radix_indices
+    from .scanner import ScanMatch, scan
+    from .stats import STATS, clock
+    from .traverse import traverse
+    from .wordlists import CompiledWordlist
 except (ImportError, ValueError):
     from bip_0039 import WORDLIST
+    from cache import cache_key
+    from radix import radix_indices
+    from scanner import ScanMatch, scan
+    from stats import STATS, clock
+    from traverse import traverse
+    from wordlists import CompiledWordlist
+
+
+# Hex characters parsed per int() call by the encoding engine.
+# Blocks are fixed-size, so every bigint operation works on a bounded value.
+BLOCK_SIZE = 64
+
+# Raw binary values that are encoded directly, without a hex string
+BINARY = (bytes, bytearray, memoryview)
+
+HEXDIGITS = "0123456789abcdefABCDEF"
+
+# numpy takes longer to import than the rest of the package, it is imported
+# by the first `transform_many` call. False until then, None if missing
+_NUMPY = False
+
+# Ways to find hex strings in text: the regex, or the single pass scanner
+ENGINES = ("regex", "scan")
+
+
+def _word_bits(wordlist):
+    """
+    Validates the wordlist and returns the bits encoded by every word
+    (0 if the wordlist can not encode anything)
+    """
+    if not isinstance(wordlist, (list, tuple, CompiledWordlist)):
+        raise TypeError("Wordlist has to be tuple, list or CompiledWordlist")
+
+    # A single word carries no information (and used to loop forever)
+    if len(wordlist) < 2:
+        return 0
+
+    return int(math.log(len(wordlist), 2))
+
+
+def _blocks(string, pad):
+    """
+    Generator that yields (value, bit size) for each block of the hex string,
+    followed by the zero padding of the LS bits
+    """
+    for i in range(0, len(string), BLOCK_SIZE):
+        block = string[i:i + BLOCK_SIZE]
+        yield int(block, 16), len(block) * 4
+
+    yield 0, pad
+
+
+def _byte_blocks(view, pad):
+    """
+    Generator that yields (value, bit size) for each block of a bytes
+    memoryview, followed by the zero padding of the LS bits. Slices of the
+    view are passed to int.from_bytes, so the buffer is never copied.
+    """
+    step = BLOCK_SIZE // 2
+
+    for i in range(0, len(view), step):
+        block = view[i:i + step]
+        yield int.from_bytes(block, "big"), len(block) * 8
+
+    yield 0, pad
+
+
+def _stream_indices(blocks, size, bits):
+    """
+    Generator that turns the (value, bit size) blocks of a `size` bits long
+    value to wordlist indices in a single pass, a block at a time
+    """
+    # The first (most significant) word takes the bits left over
+    need = size % bits or bits
+    leading = True
+    value = 0
+    held = 0
+
+    for block, size in blocks:
+        value = (value << size) | block
+        held += size
+
+        while held >= need:
+            held -= need
+            index = value >> held
+            value &= 2**held - 1
+            need = bits
+
+            if leading and not index:
+                continue
+
+            leading = False
+            yield index
+
+
+def _indices(string, bits):
+    """
+    Turns a hex string to an iterable of wordlist indices.
+
+    The result is the same as parsing the whole string as one integer,
+    shifting it left to pad it to a multiple of `bits` and reading it
+    `bits` at a time, most significant first, without leading zero words.
+    Strings longer than a block are streamed.
+    """
+    string = string.replace(":", "")
+    # The padding counts the "0x" prefix too, as it always did
+    pad = (len(string) * 4) % bits
+
+    if string[:2] in ("0x", "0X"):
+        string = string[2:]
+        if not string:
+            raise ValueError("Hex string has no digits after '0x'")
+
+    if len(string) > BLOCK_SIZE:
+        return _stream_indices(_blocks(string, pad), len(string) * 4 + pad,
+                               bits)
+
+    if not string:
+        return []
+
+    return _split(int(string, 16) << pad, bits)
+
+
+def _byte_indices(data, bits):
+    """
+    Same as `_indices` for raw binary data: the result is the same as for
+    its hex string, without building it. Data longer than a block is
+    streamed from a memoryview.
+    """
+    # Views of other formats (array('I') for example) are counted in bytes
+    if isinstance(data, memoryview):
+        data = data.cast("B")
+
+    pad = (len(data) * 8) % bits
+
+    if len(data) * 2 > BLOCK_SIZE:
+        return _stream_indices(_byte_blocks(memoryview(data), pad),
+                               len(data) * 8 + pad, bits)
+
+    return _split(int.from_bytes(data, "big") << pad, bits)
+
+
+def _split(value, bits):
+    """Wordlist indices of a value, `bits` at a time, without leading zeros"""
+    mask = 2**bits - 1
+    return [(value >> shift) & mask
+            for shift in range((value.bit_length() - 1) // bits * bits, -1,
+                               -bits)]
 
 
 # The list is not altered, so its not a dangerous default value anymore:
 # pylint: disable=dangerous-default-value
-def transform(string, wordlist=WORDLIST):
+def transform_iter(string, wordlist=WORDLIST, radix=False):
+    """
+    Same as `transform` but returns a generator that yields each word as
+    soon as it is computed. Useful for huge hex strings, as no list with
+    the result is ever built.
+
+    string: <str, bytes, bytearray, memoryview> Hex string to transform,
+            or the raw binary value
+    wordlist: <tuple, list, CompiledWordlist> Tuple containing words
+    radix: <bool> Mixed-radix encoding, see `transform`
+
+    return value: <generator> Generator yielding the resulting words
+
+    Example:
+        >>> list(hexwordify.transform_iter("DEADBEEF"))
+            ['dash', 'fork', 'upon', 'length']
+    """
+    if isinstance(string, str):
+        indices = _indices
+    elif isinstance(string, BINARY):
+        indices = _byte_indices
+    else:
+        raise TypeError("String has to be str or bytes (wtf man?)")
+
+    bits = _word_bits(wordlist)
+
+    if not bits:
+        return iter(())
+
+    if radix:
+        found = radix_indices(string, len(wordlist))
+    else:
+        found = indices(string, bits)
+
+    # Compiled wordlists are validated, their words need no stripping
+    if isinstance(wordlist, CompiledWordlist):
+        return (wordlist[index] for index in found)
+
+    return (wordlist[index].strip() for index in found)
+
+
+def transform(string, wordlist=WORDLIST, cache=None, radix=False):
     """
     Transforms a hexadecimal string to a string of words delimited with space.
 
-    string: <str> Hex string to transform
-    wordlist: <tuple, list> Tuple containing words (duh...)
+    string: <str, bytes, bytearray, memoryview> Hex string to transform, or
+            the raw binary value (a digest for example). Binary values give
+            the same words as their hex string
+    wordlist: <tuple, list, CompiledWordlist> Tuple containing words (duh...)
               Length is recommended to be a power of 2
+    cache: <LRUCache, DiskCache> Cache consulted before transforming
+    radix: <bool> Write the value in base len(wordlist) instead of reading
+           it a power of 2 of bits at a time. Lists of other lengths (like
+           the 7776 words EFF list) give fewer words. There is no padding,
+           the words are not the same as without it
 
     return value: <list> List containing resulting words
 
     Example:
         >>> hexwordify.transform("DEADBEEF")
             ['dash', 'fork', 'upon', 'length']
+        >>> hexwordify.transform(b"\xde\xad\xbe\xef")
+            ['dash', 'fork', 'upon', 'length']
+        >>> hexwordify.transform("DEADBEEF", radix=True)
+            ['hungry', 'report', 'target']
     """
-    dictlist = []
+    if cache is not None:
+        words = _cached_words(string, wordlist, cache, radix)
+        return words.split() if words else []
+
+    if STATS.enabled:
+        start = clock()
+        result = list(transform_iter(string, wordlist, radix))
+        STATS.time("transform", clock() - start)
+        return result
 
-    if not isinstance(string, str):
-        raise TypeError("String has to be str (wtf man?)")
+    return list(transform_iter(string, wordlist, radix))
 
-    if not isinstance(wordlist, (list, tuple)):
-        raise TypeError("Wordlist has to be tuple or list")
 
-    if len(wordlist) < 1:
-        return []
+def _numpy():
+    """The numpy module, None if it is not installed"""
+    global _NUMPY  # pylint: disable=global-statement
 
-    string = string.replace(":", "")
-    logarithm = int(math.log(len(wordlist), 2))
-    mask = 2**logarithm - 1
+    if _NUMPY is False:
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+        _NUMPY = numpy
+
+    return _NUMPY
+
+
+def _numpy_indices(digits, length, bits):
+    """
+    Turns a batch of equal length hex strings to rows of wordlist indices
+    by unpacking them to a bit matrix. Leading zero words are kept.
+    """
+    if length % 2:
+        digits = ["0" + string for string in digits]
+
+    numpy = _numpy()
+    nbytes = (length + 1) // 2
+    raw = numpy.frombuffer(bytes.fromhex("".join(digits)), dtype=numpy.uint8)
+    unpacked = numpy.unpackbits(raw.reshape(len(digits), nbytes), axis=1)
 
-    # Split hex string to 64 bit integers (every character is 4 bits)
-    for i in range(0, int(len(string) / 128) + bool(len(string) % 128)):
-        # Parse string as hex
-        hex_string = int(string[i * 128:(i + 1) * 128], 16)
-        # Pad LS bits
-        hex_string = hex_string << ((len(string) * 4) % logarithm)
+    pad = (length * 4) % bits
+    total = length * 4 + pad
+    width = -(-total // bits) * bits
 
-        while hex_string > 0:
-            hex_index = hex_string & mask
-            dictlist.insert(0, wordlist[hex_index].strip())
-            hex_string = hex_string >> logarithm
+    # Left align to a whole number of words, pad LS bits
+    matrix = numpy.zeros((len(digits), width), dtype=numpy.uint8)
+    matrix[:, width - total:width - pad] = \
+        unpacked[:, nbytes * 8 - length * 4:]
 
-    return dictlist
+    weights = 2 ** numpy.arange(bits - 1, -1, -1, dtype=numpy.int64)
+    return matrix.reshape(len(digits), -1, bits) @ weights
 
 
-def wrapper(string, prepend=True, color=False):
+def transform_many(hex_strings, wordlist=WORDLIST):
+    """
+    Transforms many hexadecimal strings at once. The result is the same as
+    calling `transform` on each string, but the setup is done once and, if
+    numpy is installed, strings of the same length are converted together.
+
+    hex_strings: <iterable> Hex strings to transform
+    wordlist: <tuple, list, CompiledWordlist> Tuple containing words
+
+    return value: <list> List containing a list of words for each string
+
+    Example:
+        >>> hexwordify.transform_many(["DEADBEEF", "CAFEBABE"])
+            [['dash', 'fork', 'upon', 'length'],
+            ['crawl', 'word', 'program', 'abandon']]
+    """
+    hex_strings = list(hex_strings)
+    bits = _word_bits(wordlist)
+
+    if not all(isinstance(string, str) for string in hex_strings):
+        raise TypeError("Strings have to be str")
+
+    if not bits:
+        return [[] for _ in hex_strings]
+
+    words = [word.strip() for word in wordlist]
+    result = [None] * len(hex_strings)
+    groups = {}
+    numpy = _numpy()
+
+    for pos, string in enumerate(hex_strings):
+        digits = string.replace(":", "")
+
+        # "0x" prefixed or invalid strings are left to the generic path
+        if numpy is not None and digits and not digits.strip(HEXDIGITS):
+            groups.setdefault(len(digits), ([], []))
+            groups[len(digits)][0].append(pos)
+            groups[len(digits)][1].append(digits)
+        else:
+            result[pos] = [words[index] for index in _indices(string, bits)]
+
+    if groups:
+        words = numpy.array(words, dtype=object)
+
+    for length, (positions, digits) in groups.items():
+        rows = _numpy_indices(digits, length, bits)
+        nonzero = rows != 0
+        starts = numpy.where(nonzero.any(axis=1), nonzero.argmax(axis=1),
+                             rows.shape[1])
+
+        for pos, row, start in zip(positions, words[rows].tolist(),
+                                   starts.tolist()):
+            result[pos] = row[start:]
+
+    return result
+
+
+def _cached_words(string, wordlist, cache, radix=False):
+    """Space delimited words of a hex string, through the cache"""
+    key = cache_key(string, wordlist, radix)
+    words = cache.get(key)
+
+    if words is None:
+        words = " ".join(transform(string, wordlist, radix=radix))
+        cache.put(key, words, wordlist)
+
+        if STATS.enabled:
+            STATS.count("cache_misses")
+    elif STATS.enabled:
+        STATS.count("cache_hits")
+
+    return words
+
+
+# pylint: disable=too-many-arguments
+def wrapper(string, prepend=True, color=False, wordlist=WORDLIST, cache=None):
     """
     Console wrapper. Takes care of coloring and original string appending
 
     string: <str> Hex string to transform
     prepend: <bool> Prepend given string to result
     color: <bool> Add bash color escape codes
+    wordlist: <tuple, list, CompiledWordlist> Tuple containing words
+    cache: <LRUCache> Cache of the resulting words
 
     return value: <str> Returns the result as a space delimited string
 
@@ -74,35 +379,392 @@ def wrapper(string, prepend=True, color=False):
         >>> hexwordify.wrapper("DEADBEEF", False, False)
             'dash fork upon length'
     """
-    result = ""
-    if prepend:
-        result = string + ": "
+    if STATS.enabled:
+        start = clock()
+        transformed = STATS.timers["transform"]
+        words = _wrapper_words(string, wordlist, cache)
+        result = _decorate(string, words, prepend, color)
+        STATS.count("matches")
+        # Cached words are emitted too
+        STATS.count("words", _count(words))
+        STATS.time("render", clock() - start -
+                   (STATS.timers["transform"] - transformed))
+        return result
 
-    if color:
-        result += "\x1b[32;1m"
+    return _decorate(string, _wrapper_words(string, wordlist, cache), prepend,
+                     color)
+
+
+def _count(words):
+    """Number of words of a space delimited string"""
+    return words.count(" ") + 1 if words else 0
+
+
+def _wrapper_words(string, wordlist, cache):
+    """Space delimited words of `wrapper`"""
+    if cache is None:
+        return " ".join(transform(string, wordlist))
 
-    result += " ".join(transform(string))
+    return _cached_words(string, wordlist, cache)
 
+
+def _decorate(string, words, prepend, color):
+    """The words with the options of `wrapper`"""
     if color:
-        result += "\x1b[0m"
+        words = "\x1b[32;1m" + words + "\x1b[0m"
+
+    if prepend:
+        return (string + ": " + words).strip()
+
+    return words.strip()
+
+
+def _text(string):
+    """Hex string of a hex string or binary value, for prepending"""
+    return string if isinstance(string, str) else string.hex()
+
+
+class Finder:
+    """
+    Reusable `finder`. The pattern is compiled, the wordlist is checked and
+    the options are bound once, so calling it many times on small values is
+    cheap.
 
-    return result.strip()
+    min_size: <int> Minimum consecutive characters that have to be found to be
+                    considered a hex string
+    replace: <bool> Replace the found string with the resulting words
+    prepend: <bool> Prepend the found string to the resulting words
+    color: <bool> Add terminal color escape codes
+    wordlist: <tuple, list, CompiledWordlist> Tuple containing words
+    cache: <LRUCache> Cache of the resulting words
+    engine: <str> "regex" or "scan". The scanner finds the same strings in
+                  a single pass, without retrying on runs shorter than
+                  `min_size` (the regex is still used if `min_size` < 1)
+    radix: <bool> Mixed-radix encoding, see `transform`
+
+    Examples:
+        >>> find = hexwordify.Finder(min_size=8)
+        >>> find.sub("key DEADBEEF")
+            'key dash fork upon length'
+        >>> find.findall("DEADBEEF CAFEBABE")
+            ['dash fork upon length', 'crawl word program abandon']
+    """
+    # pylint: disable=too-many-arguments
+    def __init__(self, min_size=16, replace=True, prepend=False, color=False,
+                 wordlist=WORDLIST, cache=None, engine="regex", radix=False):
+        if engine not in ENGINES:
+            raise ValueError("Engine has to be one of %s" % ", ".join(ENGINES))
+
+        self.min_size = min_size
+        self.replace = replace
+        self.prepend = prepend
+        self.color = color
+        self.wordlist = wordlist
+        self.cache = cache
+        self.engine = engine
+        self.radix = radix
+
+        # Imported here, plain `transform` calls don't need it
+        import re
+
+        self.regex = re.compile(r"(?:0x)?[0-9a-f:]{%s,}" % min_size,
+                                re.I | re.M)
+        self._scan = engine == "scan" and min_size >= 1
+        self.bits = _word_bits(wordlist)
+        self.words = [word.strip() for word in wordlist]
+        self._start, self._end = ("\x1b[32;1m", "\x1b[0m") if color \
+            else ("", "")
+
+    def _words(self, string):
+        """Space delimited words of a hex string, through the cache"""
+        if self.cache is None:
+            return self._transform(string)
+
+        key = cache_key(string, self.wordlist, self.radix)
+        words = self.cache.get(key)
+
+        if words is None:
+            words = self._transform(string)
+            self.cache.put(key, words, self.wordlist)
+
+            if STATS.enabled:
+                STATS.count("cache_misses")
+        elif STATS.enabled:
+            STATS.count("cache_hits")
+
+        return words
+
+    def _transform(self, string):
+        """Space delimited words of a hex string (or binary value)"""
+        if not self.bits:
+            return ""
+
+        if self.radix:
+            indices, base = radix_indices, len(self.words)
+        elif isinstance(string, str):
+            indices, base = _indices, self.bits
+        else:
+            indices, base = _byte_indices, self.bits
+
+        if STATS.enabled:
+            start = clock()
+            words = [self.words[index] for index in indices(string, base)]
+            STATS.time("transform", clock() - start)
+            return " ".join(words)
+
+        return " ".join([self.words[index] for index in indices(string, base)])
+
+    def render(self, string):
+        """
+        Same as `wrapper` with the bound options
+
+        string: <str, bytes, bytearray, memoryview> Hex string to transform,
+                or the raw binary value
+
+        return value: <str> Returns the result as a space delimited string
+        """
+        if STATS.enabled:
+            return self._render_measured(string)
+
+        words = self._words(string)
+
+        if self.prepend:
+            return (_text(string) + ": " + self._start + words +
+                    self._end).strip()
+
+        return (self._start + words + self._end).strip()
+
+    def _render_measured(self, string):
+        """`render`, counting the match and timing the rendering"""
+        start = clock()
+        transformed = STATS.timers["transform"]
+        words = self._words(string)
+
+        if self.prepend:
+            result = (_text(string) + ": " + self._start + words +
+                      self._end).strip()
+        else:
+            result = (self._start + words + self._end).strip()
+
+        STATS.count("matches")
+        # Cached words are emitted too
+        STATS.count("words", _count(words))
+        STATS.time("render", clock() - start -
+                   (STATS.timers["transform"] - transformed))
+        return result
+
+    def _render_match(self, match):
+        """Renders a regex match"""
+        return self.render(match.group(0))
+
+    def _sub(self, string):
+        """Replaces every hex string found, with the selected engine"""
+        if not self._scan:
+            return self.regex.sub(self._render_match, string)
+
+        pieces = []
+        last = 0
+
+        for start, end in scan(string, self.min_size):
+            pieces.append(string[last:start])
+            pieces.append(self.render(string[start:end]))
+            last = end
+
+        if not pieces:
+            return string
+
+        pieces.append(string[last:])
+        return "".join(pieces)
+
+    def _findall(self, string):
+        """Every hex string found, with the selected engine"""
+        if not self._scan:
+            return self.regex.findall(string)
+
+        return [string[start:end]
+                for start, end in scan(string, self.min_size)]
+
+    def _search(self, string):
+        """First hex string found or None, with the selected engine"""
+        if not self._scan:
+            match = self.regex.search(string)
+            return match.group(0) if match else None
+
+        for start, end in scan(string, self.min_size):
+            return string[start:end]
+
+        return None
+
+    def sub(self, string):
+        """
+        Replaces every hex string found with the resulting words
+
+        string: <str> String to search
+
+        return value: <str> The string with hex strings replaced
+        """
+        if STATS.enabled:
+            start = clock()
+            result = self._sub(string).strip()
+            STATS.time("scan", clock() - start)
+            STATS.count("bytes_scanned", len(string))
+            return result
+
+        return self._sub(string).strip()
+
+    def findall(self, string):
+        """
+        Finds every hex string and transforms it
+
+        string: <str> String to search
+
+        return value: <list> The resulting words of each hex string found
+        """
+        if STATS.enabled:
+            start = clock()
+            result = [self.render(val) for val in self._findall(string)]
+            STATS.time("scan", clock() - start)
+            STATS.count("bytes_scanned", len(string))
+            return result
+
+        return [self.render(val) for val in self._findall(string)]
+
+    def finditer(self, string):
+        """
+        Generator that finds hex strings and transforms them
+
+        string: <str> String to search
+
+        return value: <generator> Yields (match object, resulting words)
+                      for each hex string found. The scan engine yields
+                      ScanMatch objects, with the same start, end, span
+                      and group methods
+        """
+        if self._scan:
+            matches = (ScanMatch(string, start, end)
+                       for start, end in scan(string, self.min_size))
+        else:
+            matches = self.regex.finditer(string)
+
+        if STATS.enabled:
+            yield from self._finditer_measured(string, matches)
+            return
+
+        for match in matches:
+            yield match, self.render(match.group(0))
+
+    def _finditer_measured(self, string, matches):
+        """`finditer`, timing the scan without the time of the caller"""
+        STATS.count("bytes_scanned", len(string))
+        start = clock()
+
+        for match in matches:
+            result = self.render(match.group(0))
+            STATS.time("scan", clock() - start)
+            yield match, result
+            start = clock()
+
+        STATS.time("scan", clock() - start)
+
+    def lines(self, lines):
+        """
+        Generator that runs on each line and yields the resulting lines.
+        If `replace` is off, lines without hex strings are skipped (like grep)
+
+        lines: <iterable> Lines to search (a file object works)
 
+        return value: <generator> Yields each resulting line, with a newline
+        """
+        for line in lines:
+            result = self(line)
+
+            if self.replace or result:
+                yield result + "\n"
 
-def finder(vals, min_size=16, replace=True, prepend=False, color=False):
+    def __call__(self, vals):
+        """
+        Same as `finder` with the bound options
+
+        vals: <str, bytes, int, float, list, tuple, dict> Values to be
+              searched
+        """
+        if isinstance(vals, str):
+            if self.replace:
+                return self.sub(vals)
+
+            if STATS.enabled:
+                start = clock()
+                match = self._search(vals)
+                result = "" if match is None else self.render(match)
+                STATS.time("scan", clock() - start)
+                STATS.count("bytes_scanned", len(vals))
+                return result
+
+            match = self._search(vals)
+            return "" if match is None else self.render(match)
+
+        if isinstance(vals, BINARY):
+            return self.render(vals)
+
+        if isinstance(vals, float):
+            return self(hex(int(vals)))
+
+        if isinstance(vals, int):
+            return self(hex(vals))
+
+        # Nested values are walked without recursion, any depth works
+        if isinstance(vals, (list, tuple, dict)):
+            return traverse(vals, self)
+
+        raise TypeError("'vals' can be str, bytes, int, float, list, tuple, "
+                        "dict")
+
+
+# Finder instances used by `finder`, by options
+_FINDERS = {}
+_FINDERS_SIZE = 64
+
+
+# pylint: disable=too-many-arguments
+def _default_finder(min_size, replace, prepend, color, wordlist, cache=None,
+                    engine="regex", radix=False):
+    """Returns a cached Finder for the given options"""
+    # Wordlists and caches are keyed by id, the Finder keeps them alive
+    key = (min_size, replace, prepend, color, id(wordlist), id(cache), engine,
+           radix)
+
+    try:
+        return _FINDERS[key]
+    except KeyError:
+        if len(_FINDERS) >= _FINDERS_SIZE:
+            _FINDERS.clear()
+
+        _FINDERS[key] = Finder(min_size, replace, prepend, color, wordlist,
+                               cache, engine, radix)
+        return _FINDERS[key]
+
+
+# pylint: disable=too-many-arguments
+def finder(vals, min_size=16, replace=True, prepend=False, color=False,
+           wordlist=WORDLIST, cache=None, engine="regex", radix=False):
     """
     Function that finds hexadecimal values and transforms them.
 
-    vals: <str, int, float, list, tuple, dict> Values to be searched
-            The string can include semicolons (:)
+    vals: <str, bytes, int, float, list, tuple, dict> Values to be searched
+            The string can include semicolons (:). Bytes (bytearray,
+            memoryview) are raw values and are always transformed
     prepend: <bool> Prepend the found string to the resulting words
     color: <bool> Add terminal color escape codes
     min_size: <int> Minimum consecutive characters that have to be found to be
                     considered a hex string
     replace: <bool> Replace the found string with the resulting words
+    wordlist: <tuple, list, CompiledWordlist> Tuple containing words
+    cache: <LRUCache> Cache of the resulting words
+    engine: <str> "regex" or "scan", see `Finder`
+    radix: <bool> Mixed-radix encoding, see `transform`
 
     return value:
-        if vals is <str, int, float> a <str> of space delimited words
+        if vals is <str, bytes, int, float> a <str> of space delimited words
         if vals is <list, tuple> a <list> with the appropriate return value for
             each item (see examples)
         if vals is <dict> a <dict> with the appropriate return value for each
@@ -125,39 +787,5 @@ def finder(vals, min_size=16, replace=True, prepend=False, color=False):
             {'a': 'this is a test assume fine wing wink pumpkin wash scale',
             'b': 'ability cash clinic time betray social job'}
     """
-    def wrapper_args(matches):
-        """Simple wrapper to add arguments as needed"""
-        return wrapper(matches.group(0), prepend, color)
-
-    if isinstance(vals, float):
-        return finder(int(vals), min_size, replace, prepend, color)
-
-    if isinstance(vals, int):
-        return finder(hex(vals), min_size, replace, prepend, color)
-
-    if isinstance(vals, (list, tuple)):
-        result = []
-
-        for val in vals:
-            result.append(finder(val, min_size, replace, prepend, color))
-
-        return result
-
-    if isinstance(vals, dict):
-        result = {}
-
-        for key in vals:
-            result[key] = finder(vals[key], min_size, replace, prepend, color)
-
-        return result
-
-    if isinstance(vals, str):
-        regex = re.compile(r"(?:0x)?[0-9a-f:]{%s,}" % min_size, re.I | re.M)
-
-        if replace:
-            return re.sub(regex, wrapper_args, vals).strip()
-
-        for val in re.findall(regex, vals):
-            return wrapper(val, prepend, color)
-
-    raise TypeError("'vals' can be str, int, float, list, tuple, dict")
+    return _default_finder(min_size, replace, prepend, color, wordlist,
+                           cache, engine, radix)(vals)
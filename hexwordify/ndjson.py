@@ -0,0 +1,234 @@
+"""
+Newline delimited JSON. Each line is parsed, rewritten in place and written
+back on its own, so memory is bound by the largest record. The json module
+parses and writes records recursively, documents nested deeper than the
+recursion limit are parsed and written by the iterative fallbacks here.
+
+Example:
+    >>> find = hexwordify.Finder(min_size=32)
+    >>> for line in hexwordify.ndjson.rewrite(open("api.log"), find,
+    ...                                       paths=["request.key.*"]):
+    ...     sys.stdout.write(line)
+"""
+import json
+import re
+from json.decoder import scanstring
+from json.encoder import encode_basestring_ascii
+from json.scanner import NUMBER_RE
+from .traverse import traverse
+
+WHITESPACE = re.compile(r"[ \t\n\r]*")
+# Literals the json module accepts, by first character
+LITERALS = {"n": ("null", None), "t": ("true", True), "f": ("false", False),
+            "N": ("NaN", float("nan")), "I": ("Infinity", float("inf")),
+            "-": ("-Infinity", float("-inf"))}
+_END = object()
+
+
+def loads(string):
+    """Same as json.loads, for documents of any depth"""
+    try:
+        return json.loads(string)
+    except RecursionError:
+        return _loads(string)
+
+
+def _skip(string, pos):
+    """Position of the first non whitespace character at or after `pos`"""
+    return WHITESPACE.match(string, pos).end()
+
+
+def _key(string, pos):
+    """Parses an object key and its colon, returns (key, position after)"""
+    if string[pos:pos + 1] != '"':
+        raise json.JSONDecodeError("Expecting property name enclosed in "
+                                   "double quotes", string, pos)
+
+    key, pos = scanstring(string, pos + 1)
+    pos = _skip(string, pos)
+
+    if string[pos:pos + 1] != ":":
+        raise json.JSONDecodeError("Expecting ':' delimiter", string, pos)
+
+    return key, _skip(string, pos + 1)
+
+
+def _scalar(string, pos):
+    """Parses a string, number or literal, returns (value, position after)"""
+    if string[pos:pos + 1] == '"':
+        return scanstring(string, pos + 1)
+
+    match = NUMBER_RE.match(string, pos)
+    if match is not None:
+        integer, fraction, exponent = match.groups()
+
+        if fraction or exponent:
+            return float(integer + (fraction or "") + (exponent or "")), \
+                match.end()
+        return int(integer), match.end()
+
+    literal, value = LITERALS.get(string[pos:pos + 1], ("", None))
+    if literal and string.startswith(literal, pos):
+        return value, pos + len(literal)
+
+    raise json.JSONDecodeError("Expecting value", string, pos)
+
+
+def _loads(string):
+    """Iterative json.loads, open containers are kept on a stack"""
+    # Containers being parsed and the key of each (None for lists)
+    stack = []
+    keys = []
+    pos = _skip(string, 0)
+
+    while True:
+        char = string[pos:pos + 1]
+
+        if char in ("{", "["):
+            pos = _skip(string, pos + 1)
+
+            if string[pos:pos + 1] == ("}" if char == "{" else "]"):
+                value = {} if char == "{" else []
+                pos += 1
+            elif char == "{":
+                stack.append({})
+                key, pos = _key(string, pos)
+                keys.append(key)
+                continue
+            else:
+                stack.append([])
+                keys.append(None)
+                continue
+        else:
+            value, pos = _scalar(string, pos)
+
+        # Adds the value to its container, closing the containers that end
+        while True:
+            pos = _skip(string, pos)
+
+            if not stack:
+                if pos != len(string):
+                    raise json.JSONDecodeError("Extra data", string, pos)
+                return value
+
+            container = stack[-1]
+            if keys[-1] is None:
+                container.append(value)
+            else:
+                container[keys[-1]] = value
+
+            char = string[pos:pos + 1]
+
+            if char == ",":
+                pos = _skip(string, pos + 1)
+                if keys[-1] is not None:
+                    keys[-1], pos = _key(string, pos)
+                break
+
+            if char != ("]" if keys[-1] is None else "}"):
+                raise json.JSONDecodeError("Expecting ',' delimiter", string,
+                                           pos)
+
+            value = stack.pop()
+            keys.pop()
+            pos += 1
+
+
+def dumps(value):
+    """Same as json.dumps, for documents of any depth"""
+    try:
+        return json.dumps(value)
+    except RecursionError:
+        return "".join(_dumps(value))
+
+
+def _encode(value):
+    """JSON of a value that is not a container, like json.dumps"""
+    if isinstance(value, str):
+        return encode_basestring_ascii(value)
+
+    return json.dumps(value)
+
+
+def _encode_key(key):
+    """JSON of an object key, non string keys are turned to strings"""
+    if isinstance(key, str):
+        return encode_basestring_ascii(key)
+
+    if key is None or isinstance(key, (bool, int, float)):
+        return '"%s"' % json.dumps(key)
+
+    raise TypeError("keys must be str, int, float, bool or None, not %s" %
+                    type(key).__name__)
+
+
+def _dumps(value):
+    """Iterative json.dumps, returns the chunks of the result"""
+    chunks = []
+    # [items, closing bracket, is a dict, is the first item]
+    stack = []
+
+    while True:
+        if isinstance(value, dict) and value:
+            chunks.append("{")
+            stack.append([iter(value.items()), "}", True, True])
+        elif isinstance(value, (list, tuple)) and value:
+            chunks.append("[")
+            stack.append([iter(value), "]", False, True])
+        elif isinstance(value, dict):
+            chunks.append("{}")
+        elif isinstance(value, (list, tuple)):
+            chunks.append("[]")
+        else:
+            chunks.append(_encode(value))
+
+        # The next value, from the innermost container with items left
+        while stack:
+            entry = stack[-1]
+            item = next(entry[0], _END)
+
+            if item is _END:
+                chunks.append(entry[1])
+                stack.pop()
+                continue
+
+            if not entry[3]:
+                chunks.append(", ")
+            entry[3] = False
+
+            if entry[2]:
+                key, value = item
+                chunks.append(_encode_key(key) + ": ")
+            else:
+                value = item
+            break
+        else:
+            return chunks
+
+
+def rewrite(lines, find, paths=None):
+    """
+    Generator that rewrites the strings of each JSON record with `find`,
+    one record at a time. Blank lines and lines that are not JSON are
+    yielded as they are.
+
+    lines: <iterable> Lines of NDJSON (a file object works)
+    find: <function> Called with each string, returns its new value (a
+          Finder works)
+    paths: <iterable> Dotted paths of the values to rewrite, see `traverse`
+
+    return value: <generator> Yields each resulting line, with a newline
+    """
+    for line in lines:
+        if not line.strip():
+            yield line
+            continue
+
+        try:
+            record = loads(line)
+        except ValueError:
+            yield line if line.endswith("\n") else line + "\n"
+            continue
+
+        yield dumps(traverse(record, find, paths, inplace=True,
+                             leaves=(str,))) + "\n"
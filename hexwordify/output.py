@@ -0,0 +1,139 @@
+"""
+Structured output. Every hex string found is a record of where it was found,
+the hex string itself and its words. Records are encoded and written to a
+binary file through a buffer as they are produced, without color codes
+(those belong to the text output only).
+
+Example:
+    >>> find = hexwordify.Finder(min_size=32)
+    >>> with hexwordify.output.JSONLinesWriter(sys.stdout.buffer) as writer:
+    ...     for record in hexwordify.output.records(find, fileo, "keys.txt"):
+    ...         writer.write(record)
+"""
+import collections
+import json
+from .filescan import scan_file
+
+BUFFER_SIZE = 1 << 16
+
+# line is None for memory mapped files, whose offset is in bytes.
+# Otherwise offset is the position of the hex string in its line
+Record = collections.namedtuple("Record",
+                                ("source", "line", "offset", "hex", "words"))
+
+
+class Writer:
+    """
+    Base record writer, subclasses encode the records
+
+    output: <binary file> Where the records are written
+    buffer_size: <int> Bytes kept before writing to `output`
+    fields: <tuple> Fields of the records (namedtuples), Record by default
+    """
+    def __init__(self, output, buffer_size=BUFFER_SIZE,
+                 fields=Record._fields):
+        self.output = output
+        self.buffer_size = buffer_size
+        self.fields = fields
+        self._buffer = bytearray(self.header())
+
+    def header(self):
+        """Returns what is written before the records, as bytes"""
+        return b""
+
+    def render(self, record):
+        """Returns the encoded record, as bytes"""
+        raise NotImplementedError
+
+    def write(self, record):
+        """Buffers a record, writing the buffer out when it is full"""
+        self._buffer += self.render(record)
+
+        if len(self._buffer) >= self.buffer_size:
+            self.output.write(self._buffer)
+            self._buffer = bytearray()
+
+    def flush(self):
+        """Writes out the buffered records"""
+        if self._buffer:
+            self.output.write(self._buffer)
+            self._buffer = bytearray()
+
+        self.output.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.flush()
+
+
+class TextWriter(Writer):
+    """Writes records that are already rendered lines of text"""
+
+    def render(self, record):
+        return record.encode()
+
+
+class JSONLinesWriter(Writer):
+    """Writes a JSON object per record"""
+
+    def render(self, record):
+        return (json.dumps(record._asdict()) + "\n").encode()
+
+
+def _field(value):
+    """A TSV field, with tabs, newlines and backslashes escaped"""
+    if value is None:
+        return ""
+
+    if isinstance(value, (list, tuple)):
+        value = " ".join(value)
+
+    return str(value).replace("\\", "\\\\").replace("\t", "\\t") \
+        .replace("\n", "\\n").replace("\r", "\\r")
+
+
+class TSVWriter(Writer):
+    """Writes a header and a tab separated line per record"""
+
+    def header(self):
+        return ("\t".join(self.fields) + "\n").encode()
+
+    def render(self, record):
+        return ("\t".join([_field(value) for value in record]) +
+                "\n").encode()
+
+
+WRITERS = {"jsonl": JSONLinesWriter, "tsv": TSVWriter}
+FORMATS = ("text",) + tuple(WRITERS)
+
+
+def records(find, lines, source=None):
+    """
+    Generator of the records of the hex strings found in each line
+
+    find: <Finder> Finder to search with, without prepend or color
+    lines: <iterable> Lines to search (a file object works)
+    source: <str> Name of the input, like its path
+
+    return value: <generator> Yields a Record for each hex string found
+    """
+    for number, line in enumerate(lines, 1):
+        for match, words in find.finditer(line):
+            yield Record(source, number, match.start(), match.group(0),
+                         words.split())
+
+
+def mapped_records(find, path):
+    """
+    Generator of the records of the hex strings found in a memory mapped
+    file, with their byte offset
+
+    find: <Finder> Finder to transform with, without prepend or color
+    path: <str> File to search
+
+    return value: <generator> Yields a Record for each hex string found
+    """
+    for start, _, string in scan_file(path, find.min_size):
+        yield Record(path, None, start, string, find.render(string).split())
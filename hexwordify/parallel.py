@@ -0,0 +1,96 @@
+"""
+Multi-process `finder`. Input is cut into line aligned blocks that are
+processed by a pool of workers, each with its own Finder. Results come back
+in the original order, the same as a line by line run.
+"""
+import collections
+import io
+import os
+from .bip_0039 import WORDLIST
+from .cache import LRUCache
+from .hexwordify import Finder
+
+BLOCK_SIZE = 1 << 20
+
+# Finder of the worker process, set up once by `_init_worker`
+_WORKER = None
+
+
+def _init_worker(cache_size, engine, *args):
+    """Sets up the Finder (and cache) of a worker process"""
+    global _WORKER  # pylint: disable=global-statement
+    _WORKER = Finder(*args, cache=LRUCache(cache_size) if cache_size else None,
+                     engine=engine)
+
+
+def _process(block):
+    """Runs the worker's Finder on each line of a block"""
+    return "".join(_WORKER.lines(io.StringIO(block)))
+
+
+def blocks(fileo, size=BLOCK_SIZE):
+    """
+    Generator that cuts a file to blocks of whole lines
+
+    fileo: <file> Text file to read
+    size: <int> Approximate characters per block
+
+    return value: <generator> Yields each block as a str
+    """
+    while True:
+        block = fileo.read(size)
+        if not block:
+            return
+
+        # Complete the last line
+        if not block.endswith("\n"):
+            block += fileo.readline()
+
+        yield block
+
+
+# pylint: disable=too-many-arguments,dangerous-default-value
+def parallel_finder(inputs, jobs=None, min_size=16, replace=True,
+                    prepend=False, color=False, wordlist=WORDLIST,
+                    block_size=BLOCK_SIZE, cache_size=0, engine="regex"):
+    """
+    Generator that runs `finder` on each line of the inputs using many
+    processes. The output is the same as `Finder.lines` on each input.
+
+    inputs: <iterable> Text files (or str) to search, in order
+    jobs: <int> Number of processes, defaults to the number of CPUs
+    block_size: <int> Approximate characters sent to a worker at a time
+    cache_size: <int> Size of the LRU cache of each worker, 0 to disable
+    engine: <str> "regex" or "scan", see `Finder`
+
+    See `finder` for the rest of the arguments
+
+    return value: <generator> Yields the result of each block, in order
+
+    Example:
+        >>> with open("audit.log") as fileo:
+        ...     for result in hexwordify.parallel_finder([fileo], jobs=8):
+        ...         sys.stdout.write(result)
+    """
+    # Imported here, multiprocessing is slow to import
+    from concurrent.futures import ProcessPoolExecutor
+
+    jobs = jobs or os.cpu_count()
+    pending = collections.deque()
+
+    with ProcessPoolExecutor(jobs, initializer=_init_worker,
+                             initargs=(cache_size, engine, min_size, replace,
+                                       prepend, color, wordlist)) as executor:
+        for fileo in inputs:
+            if isinstance(fileo, str):
+                fileo = io.StringIO(fileo)
+
+            for block in blocks(fileo, block_size):
+                pending.append(executor.submit(_process, block))
+
+                # Bound the blocks in flight (and in memory)
+                if len(pending) >= jobs * 2:
+                    yield pending.popleft().result()
+
+        while pending:
+            yield pending.popleft().result()
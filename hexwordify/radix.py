@@ -0,0 +1,173 @@
+"""
+Mixed-radix encoding. The value is written in base `len(wordlist)`, so every
+word carries log2(len(wordlist)) bits, not just the whole bits `transform`
+masks off (12 of the 12.92 bits of the 7776 words EFF list).
+
+Repeated divmod by the base is quadratic in the size of the value, so the
+conversion divides and conquers: the value is split in two halves by
+base**(2**k) and each half is converted on its own, down to values small
+enough for plain divmod. The big divisions are Burnikel-Ziegler ones, built
+of (Karatsuba) multiplications, as divmod itself is quadratic. The inverse
+combines pairs of digits the same way, with multiplications only.
+"""
+BINARY = (bytes, bytearray, memoryview)
+
+# Values up to this many bits are converted a digit at a time
+NAIVE_BITS = 1024
+# Divisions with quotients up to this many bits are left to divmod
+DIVMOD_BITS = 4000
+
+
+def _div2n1n(value, divisor, size):
+    """
+    Burnikel-Ziegler division of a value below divisor * 2**size by a
+    `size` bits divisor. Splits it in two 3n/2n divisions of half the size,
+    so it costs a few multiplications instead of a quadratic divmod
+    """
+    if value.bit_length() - size <= DIVMOD_BITS:
+        return divmod(value, divisor)
+
+    odd = size & 1
+    if odd:
+        value <<= 1
+        divisor <<= 1
+        size += 1
+
+    half = size >> 1
+    mask = (1 << half) - 1
+    high, low = divisor >> half, divisor & mask
+
+    first, rest = _div3n2n(value >> size, (value >> half) & mask, divisor,
+                           high, low, half)
+    second, rest = _div3n2n(rest, value & mask, divisor, high, low, half)
+
+    if odd:
+        rest >>= 1
+
+    return first << half | second, rest
+
+
+# pylint: disable=too-many-arguments
+def _div3n2n(top, bottom, divisor, high, low, half):
+    """Divides top * 2**half + bottom by divisor (high * 2**half + low)"""
+    if top >> half == high:
+        quotient = (1 << half) - 1
+        rest = top - (high << half) + high
+    else:
+        quotient, rest = _div2n1n(top, high, half)
+
+    rest = (rest << half | bottom) - quotient * low
+
+    # The estimate is at most 2 too large
+    while rest < 0:
+        quotient -= 1
+        rest += divisor
+
+    return quotient, rest
+
+
+def _naive_digits(value, base, width, digits):
+    """Appends the digits of a small value, zero padded to `width`"""
+    chunk = []
+
+    while value:
+        value, digit = divmod(value, base)
+        chunk.append(digit)
+
+    digits.extend([0] * (width - len(chunk)))
+    digits.extend(reversed(chunk))
+
+
+# pylint: disable=too-many-arguments
+def _convert(value, powers, level, pad, digits):
+    """
+    Appends the base powers[0] digits of a value below powers[level]**2,
+    which has at most 2**(level + 1) digits. Leading zeros are kept only if
+    `pad` is set
+    """
+    width = 2**(level + 1) if pad else 0
+
+    if level < 0 or value.bit_length() <= NAIVE_BITS:
+        _naive_digits(value, powers[0], width, digits)
+        return
+
+    # value < powers[level]**2, the quotient is at most as long as the divisor
+    high, low = _div2n1n(value, powers[level], powers[level].bit_length())
+
+    if high or pad:
+        _convert(high, powers, level - 1, pad, digits)
+        _convert(low, powers, level - 1, True, digits)
+    else:
+        _convert(low, powers, level - 1, False, digits)
+
+
+def to_digits(value, base):
+    """
+    Digits of a non negative integer in `base`, most significant first,
+    without leading zeros
+
+    Example:
+        >>> hexwordify.radix.to_digits(0xDEADBEEF, 7776)
+            [61, 6107, 3791]
+    """
+    if base < 2:
+        raise ValueError("Base has to be at least 2")
+
+    # powers[k] is base**(2**k), up to the one that splits the value
+    powers = [base]
+    while True:
+        square = powers[-1] * powers[-1]
+        if square > value:
+            break
+        powers.append(square)
+
+    digits = []
+    _convert(value, powers, len(powers) - 1, False, digits)
+    return digits
+
+
+def from_digits(digits, base):
+    """
+    Integer of base `base` digits, most significant first. Inverse of
+    `to_digits`
+
+    Example:
+        >>> hex(hexwordify.radix.from_digits([61, 6107, 3791], 7776))
+            '0xdeadbeef'
+    """
+    values = list(digits)
+    power = base
+
+    # Neighbours are joined a level at a time, a leading zero evens it out
+    while len(values) > 1:
+        if len(values) % 2:
+            values.insert(0, 0)
+
+        values = [high * power + low
+                  for high, low in zip(values[::2], values[1::2])]
+        power *= power
+
+    return values[0] if values else 0
+
+
+def radix_indices(string, base):
+    """
+    Wordlist indices of a hex string (or binary value) written in `base`,
+    without leading zeros. Colons and the "0x" prefix are dropped, there is
+    no padding
+    """
+    if isinstance(string, BINARY):
+        # Views of other formats (array('I') for example) are counted in bytes
+        if isinstance(string, memoryview):
+            string = string.cast("B")
+
+        return to_digits(int.from_bytes(string, "big"), base)
+
+    string = string.replace(":", "")
+
+    if string[:2] in ("0x", "0X"):
+        string = string[2:]
+        if not string:
+            raise ValueError("Hex string has no digits after '0x'")
+
+    return to_digits(int(string, 16), base) if string else []
@@ -0,0 +1,304 @@
+"""
+Inverse of `finder`: finds runs of wordlist words in text and turns them back
+to the hex strings they were made of. The wordlist is compiled once to a
+single regex, an alternation shaped like a trie (words sharing a prefix share
+a branch), so text is searched in one pass by the regex engine instead of a
+lookup per token.
+
+Example:
+    >>> find = hexwordify.ReverseFinder(min_words=4)
+    >>> find.sub("key: dash fork upon length")
+        'key: deadbeef'
+"""
+import re
+from .bip_0039 import WORDLIST
+from .decode import _indices_to_hex, _radix_to_hex, word_index
+from .scanner import ScanMatch
+
+# Minimum consecutive words of a run, shorter runs of common words are
+# likely to be plain text
+MIN_WORDS = 6
+# Words tried off each end of a run, plain text words that happen to be in
+# the wordlist stick to the phrases. Each word left out costs TRIM_COST bits
+# against the zero padding bits of the phrase
+TRIM = 2
+TRIM_COST = 1.5
+
+WORD = re.compile(r"\S+")
+
+
+def _trie_pattern(words):
+    """Regex alternation of `words`, with shared prefixes factored out"""
+    trie = {}
+
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        # End of a word
+        node[""] = {}
+
+    return _node_pattern(trie)
+
+
+def _node_pattern(node):
+    """Pattern of a trie node, the words below it"""
+    branches = [re.escape(char) + _node_pattern(child)
+                for char, child in sorted(node.items()) if char]
+
+    if not branches:
+        return ""
+
+    if len(branches) == 1 and "" not in node:
+        return branches[0]
+
+    pattern = "(?:" + "|".join(branches) + ")"
+    return pattern + "?" if "" in node else pattern
+
+
+class ReverseFinder:
+    """
+    Reusable inverse `finder`. The wordlist pattern is compiled and the
+    options are bound once.
+
+    min_words: <int> Minimum consecutive words (separated by spaces or
+               tabs) that have to be found to be considered a phrase
+    replace: <bool> Replace the found phrases with their hex strings
+    prepend: <bool> Prepend the found phrase to the hex string
+    color: <bool> Add terminal color escape codes
+    wordlist: <tuple, list, CompiledWordlist> Tuple containing words
+    radix: <bool> The phrases are mixed-radix encoded, see `transform`
+
+    Examples:
+        >>> find = hexwordify.ReverseFinder(min_words=4)
+        >>> find.findall("dash fork upon length, crawl word program abandon")
+            ['deadbeef', 'cafebabe']
+    """
+    # pylint: disable=too-many-arguments
+    def __init__(self, min_words=MIN_WORDS, replace=True, prepend=False,
+                 color=False, wordlist=WORDLIST, radix=False):
+        if min_words < 1:
+            raise ValueError("min_words has to be at least 1")
+
+        self.min_words = min_words
+        self.replace = replace
+        self.prepend = prepend
+        self.color = color
+        self.wordlist = wordlist
+        self.radix = radix
+
+        self.index = word_index(wordlist)
+        if not self.index.bits:
+            raise ValueError("Wordlist needs at least 2 words")
+
+        word = _trie_pattern(self.index.exact)
+        pattern = r"(?<!\w)%s(?:[ \t]+%s){%d,}(?!\w)" % (word, word,
+                                                         min_words - 1)
+        self.regex = re.compile(pattern)
+        # Case insensitive matching is a lot slower, it is only used (and
+        # compiled) for text that lowercases to another length
+        self._pattern = pattern
+        self._regex_ignorecase = None
+        self._start, self._end = ("\x1b[32;1m", "\x1b[0m") if color \
+            else ("", "")
+
+    def _decode(self, indices):
+        """
+        Hex string of the indices of a phrase, None if the words can't have
+        been made by `transform` (their padding bits are not zero)
+        """
+        try:
+            if self.radix:
+                return _radix_to_hex(indices, len(self.wordlist))
+
+            return _indices_to_hex(indices, self.index.bits)
+        except ValueError:
+            return None
+
+    def _phrase(self, string, match):
+        """
+        (start, end, hex string) of the phrase of a run of words, None if
+        there is none. The whole run is the phrase if it decodes to whole
+        bytes. Otherwise plain text words that happen to be in the wordlist
+        likely stick to it, so the run is tried with up to TRIM words off
+        each end too. Whole bytes win, then the phrase whose padding has the
+        most zero bits (the least likely to be decoded by chance), less
+        TRIM_COST bits for each word left out.
+        """
+        spans = [word.span() for word in WORD.finditer(string, match.start(),
+                                                        match.end())]
+        indices = [self.index.exact[string[start:end].lower()]
+                   for start, end in spans]
+        best = None
+
+        for size in range(len(spans),
+                          max(self.min_words, len(spans) - 2 * TRIM) - 1, -1):
+            # Words before a phrase (like "key:") are tried off first
+            for first in range(min(TRIM, len(spans) - size),
+                               max(0, len(spans) - size - TRIM) - 1, -1):
+                found = self._decode(indices[first:first + size])
+
+                if found is None:
+                    continue
+
+                score = (len(found) % 2 == 0,
+                         (len(found) * 4) % self.index.bits -
+                         TRIM_COST * (len(spans) - size))
+                if best is None or score > best[0]:
+                    best = (score, spans[first][0], spans[first + size - 1][1],
+                            found)
+
+            # Whole runs that decode to whole bytes are kept, trimming a real
+            # phrase would decode another string
+            if size == len(spans) and best is not None and best[0][0]:
+                break
+
+        return None if best is None else best[1:]
+
+    def render(self, phrase, string):
+        """The hex string of a phrase, with the bound options"""
+        if self.prepend:
+            return phrase + ": " + self._start + string + self._end
+
+        return self._start + string + self._end
+
+    def finditer(self, string):
+        """
+        Generator that finds phrases and turns them back to hex
+
+        string: <str> String to search
+
+        return value: <generator> Yields (match object, hex string) for each
+                      phrase found. Matches are ScanMatch objects, with the
+                      same start, end, span and group methods as regex ones
+        """
+        lowered = string.lower()
+
+        # Same length, same offsets
+        if len(lowered) == len(string):
+            matches = self.regex.finditer(lowered)
+        else:
+            if self._regex_ignorecase is None:
+                self._regex_ignorecase = re.compile(self._pattern, re.I)
+            matches = self._regex_ignorecase.finditer(string)
+
+        for match in matches:
+            phrase = self._phrase(string, match)
+
+            if phrase is not None:
+                start, end, found = phrase
+                yield ScanMatch(string, start, end), \
+                    self.render(string[start:end], found)
+
+    def findall(self, string):
+        """
+        Finds every phrase and turns it back to hex
+
+        string: <str> String to search
+
+        return value: <list> The hex string of each phrase found
+        """
+        return [found for _, found in self.finditer(string)]
+
+    def sub(self, string):
+        """
+        Replaces every phrase found with its hex string
+
+        string: <str> String to search
+
+        return value: <str> The string with phrases replaced
+        """
+        pieces = []
+        last = 0
+
+        for match, found in self.finditer(string):
+            pieces.append(string[last:match.start()])
+            pieces.append(found)
+            last = match.end()
+
+        if not pieces:
+            return string.strip()
+
+        pieces.append(string[last:])
+        return "".join(pieces).strip()
+
+    def lines(self, lines):
+        """
+        Generator that runs on each line and yields the resulting lines.
+        If `replace` is off, lines without phrases are skipped (like grep)
+
+        lines: <iterable> Lines to search (a file object works)
+
+        return value: <generator> Yields each resulting line, with a newline
+        """
+        for line in lines:
+            result = self(line)
+
+            if self.replace or result:
+                yield result + "\n"
+
+    def __call__(self, string):
+        """
+        Same as `reverse_finder` with the bound options
+
+        string: <str> String to search
+        """
+        if not isinstance(string, str):
+            raise TypeError("String has to be str")
+
+        if self.replace:
+            return self.sub(string)
+
+        return next((found for _, found in self.finditer(string)), "")
+
+
+# ReverseFinder instances used by `reverse_finder`, by options
+_FINDERS = {}
+_FINDERS_SIZE = 64
+
+
+# pylint: disable=too-many-arguments
+def _default_reverse_finder(min_words, replace, prepend, color, wordlist,
+                            radix=False):
+    """Returns a cached ReverseFinder for the given options"""
+    # Wordlists are keyed by id, the ReverseFinder keeps them alive
+    key = (min_words, replace, prepend, color, id(wordlist), radix)
+
+    try:
+        return _FINDERS[key]
+    except KeyError:
+        if len(_FINDERS) >= _FINDERS_SIZE:
+            _FINDERS.clear()
+
+        _FINDERS[key] = ReverseFinder(min_words, replace, prepend, color,
+                                      wordlist, radix)
+        return _FINDERS[key]
+
+
+# The list is not altered, so its not a dangerous default value anymore:
+# pylint: disable=dangerous-default-value
+def reverse_finder(string, min_words=MIN_WORDS, replace=True, prepend=False,
+                   color=False, wordlist=WORDLIST, radix=False):
+    """
+    Function that finds runs of wordlist words and turns them back to hex,
+    with the same bit layout `transform` uses. Inverse of `finder`.
+
+    string: <str> String to search
+    min_words: <int> Minimum consecutive words that have to be found to be
+               considered a phrase
+    replace: <bool> Replace the found phrases with their hex strings,
+             otherwise return only the hex string of the first one
+    prepend: <bool> Prepend the found phrase to the hex string
+    color: <bool> Add terminal color escape codes
+    wordlist: <tuple, list, CompiledWordlist> Tuple containing words
+    radix: <bool> The phrases are mixed-radix encoded, see `transform`
+
+    return value: <str> The resulting string
+
+    Example:
+        >>> hexwordify.reverse_finder("fpr: assume fine wing wink pumpkin "
+        ...                           "wash scale")
+            'fpr: deadbeefdeadbeef'
+    """
+    return _default_reverse_finder(min_words, replace, prepend, color,
+                                   wordlist, radix)(string)
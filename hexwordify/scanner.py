@@ -0,0 +1,118 @@
+"""
+Hex string scanner. Finds the same strings as the `finder` regex,
+`(?:0x)?[0-9a-f:]{min_size,}` (case insensitive), in a single left to right
+pass: characters are classified with a translation table and maximal runs of
+at least `min_size` are found with `bytes.find`, so no position is ever
+retried.
+"""
+HEX = b"0123456789abcdefABCDEF:"
+RUN = b"h"
+OTHER = b"."
+
+# Classifies each byte as part of a run or not
+TABLE = bytes(RUN[0] if byte in HEX else OTHER[0] for byte in range(256))
+
+
+class ScanMatch:
+    """Match found by the scanner, with the parts of re.Match used here"""
+    __slots__ = ("string", "span_start", "span_end")
+
+    def __init__(self, string, start, end):
+        self.string = string
+        self.span_start = start
+        self.span_end = end
+
+    def start(self):
+        """Start of the match"""
+        return self.span_start
+
+    def end(self):
+        """End of the match"""
+        return self.span_end
+
+    def span(self):
+        """(start, end) of the match"""
+        return self.span_start, self.span_end
+
+    def group(self, index=0):
+        """The matched string"""
+        if index:
+            raise IndexError("no such group")
+        return self.string[self.span_start:self.span_end]
+
+    def __repr__(self):
+        return "<ScanMatch span=%r, match=%r>" % (self.span(), self.group())
+
+
+def scan(string, min_size=16):
+    """
+    Generator that finds hex strings of at least `min_size` characters
+
+    string: <str, bytes> String to search
+    min_size: <int> Minimum consecutive characters that have to be found to be
+                    considered a hex string, at least 1
+
+    return value: <generator> Yields (start, end) of each hex string
+
+    Example:
+        >>> list(hexwordify.scan("key 0xDEADBEEF", 8))
+            [(4, 14)]
+    """
+    if min_size < 1:
+        raise ValueError("The scanner needs a min_size of at least 1")
+
+    # Encoding keeps one byte per character, anything outside latin-1 can't
+    # be a hex character anyway
+    data = string.encode("latin-1", "replace") if isinstance(string, str) \
+        else bytes(string)
+    classified = data.translate(TABLE)
+    size = len(data)
+    # Runs shorter than min_size are skipped without looking at them
+    needle = RUN * min_size
+    # Matches are yielded one run late, a "0x" prefix can take over the
+    # previous match
+    pending = None
+    pos = 0
+
+    while True:
+        found = classified.find(needle, pos)
+        if found < 0:
+            break
+
+        start = classified.rfind(OTHER, pos, found) + 1 or pos
+        end = classified.find(OTHER, found + min_size)
+        if end < 0:
+            end = size
+        pos = end
+
+        match = (start, end)
+
+        # The "0" of a "0x" prefix ends the previous run. It belongs to this
+        # match if that run wasn't matched, or if it was matched alone: the
+        # regex tries the prefix first
+        if start >= 2 and data[start - 1] in b"xX" and data[start - 2] == 48:
+            if pending is None or pending[1] != start - 1:
+                match = (start - 2, end)
+            elif pending[0] == start - 2:
+                match = (start - 2, end)
+                pending = None
+
+        if pending is not None:
+            yield pending
+
+        pending = match
+
+    if pending is not None:
+        yield pending
+
+
+def finditer(string, min_size=16):
+    """
+    Generator of the hex strings found, as ScanMatch objects
+
+    string: <str, bytes> String to search
+    min_size: <int> Minimum consecutive characters that have to be found to be
+                    considered a hex string, at least 1
+    """
+    for start, end in scan(string, min_size):
+        yield ScanMatch(string, start, end)
@@ -0,0 +1,96 @@
+"""
+Lightweight instrumentation. When enabled, finder, wrapper, transform and the
+console function count what they process and time each phase. When disabled
+(the default) every instrumentation point costs a single attribute check.
+
+Example:
+    >>> hexwordify.stats.enable()
+    >>> hexwordify.stats.add_hook(lambda summary: metrics.send(summary))
+    >>> hexwordify.finder(logs)
+    >>> hexwordify.stats.emit()
+"""
+import time
+
+COUNTERS = ("bytes_scanned", "matches", "words", "cache_hits", "cache_misses")
+TIMERS = ("io", "scan", "transform", "render")
+
+clock = time.perf_counter
+
+
+class Stats:
+    """Counters and phase timers"""
+
+    def __init__(self):
+        self.enabled = False
+        self.counters = dict.fromkeys(COUNTERS, 0)
+        self.timers = dict.fromkeys(TIMERS, 0.0)
+        self.started = clock()
+
+    def count(self, name, value=1):
+        """Adds `value` to a counter"""
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    def time(self, name, seconds):
+        """Adds `seconds` to a phase timer"""
+        self.timers[name] = self.timers.get(name, 0.0) + seconds
+
+    def reset(self):
+        """Zeroes every counter and timer"""
+        self.counters = dict.fromkeys(COUNTERS, 0)
+        self.timers = dict.fromkeys(TIMERS, 0.0)
+        self.started = clock()
+
+    def summary(self):
+        """
+        Returns the counters and timers as a dict. The scan time includes
+        the transform and render of the matches, `scan_only` does not.
+        """
+        timers = dict(self.timers)
+        timers["scan_only"] = max(0.0, timers["scan"] - timers["transform"] -
+                                  timers["render"])
+        timers["total"] = clock() - self.started
+
+        return {"counters": dict(self.counters), "seconds": timers}
+
+
+STATS = Stats()
+_HOOKS = []
+
+
+def enable():
+    """Starts collecting stats (from zero)"""
+    STATS.reset()
+    STATS.enabled = True
+
+
+def disable():
+    """Stops collecting stats"""
+    STATS.enabled = False
+
+
+def summary():
+    """Returns the collected stats as a dict"""
+    return STATS.summary()
+
+
+def add_hook(hook):
+    """
+    Registers a function that gets the summary dict on every `emit`,
+    to forward it to a metrics system
+    """
+    _HOOKS.append(hook)
+
+
+def remove_hook(hook):
+    """Unregisters a hook"""
+    _HOOKS.remove(hook)
+
+
+def emit():
+    """Passes the current summary to every hook and returns it"""
+    result = STATS.summary()
+
+    for hook in _HOOKS:
+        hook(result)
+
+    return result
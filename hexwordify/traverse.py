@@ -0,0 +1,116 @@
+"""
+Iterative traversal of nested lists and dicts (parsed JSON documents). The
+containers are walked with an explicit stack, so there is no recursion limit,
+and the values can be rewritten in place instead of copying the document.
+Paths select the values that are rewritten, like "keys.*.fingerprint".
+
+Example:
+    >>> find = hexwordify.Finder(min_size=8)
+    >>> hexwordify.traverse({"id": "DEADBEEF", "fpr": "DEADBEEF"}, find,
+    ...                     paths=["fpr"])
+        {'id': 'DEADBEEF', 'fpr': 'dash fork upon length'}
+"""
+# Leaves that are passed to `find`, bools are ints but mean no number
+LEAVES = (str, bytes, bytearray, memoryview, int, float)
+
+
+def _patterns(paths):
+    """
+    Dotted paths as tuples of key matchers (the match method of each key
+    pattern, compiled once), None to select everything
+    """
+    if paths is None:
+        return None
+
+    # Imported here, fnmatch imports re and most values have no paths
+    import fnmatch
+    import re
+
+    return [(tuple(re.compile(fnmatch.translate(key)).match
+                   for key in path.split(".")), 0) for path in paths]
+
+
+def _child(state, key):
+    """
+    Selection state of a child: None if every value under it is selected,
+    else the patterns (and how many of their keys matched) that may still
+    select something under it
+    """
+    if state is None:
+        return None
+
+    child = []
+    key = str(key)
+
+    for pattern, depth in state:
+        if pattern[depth](key):
+            if depth + 1 == len(pattern):
+                return None
+            child.append((pattern, depth + 1))
+
+    return child
+
+
+def traverse(value, find, paths=None, inplace=False, leaves=LEAVES):
+    """
+    Rewrites every leaf of a nested structure of lists, tuples and dicts
+    with `find`, without recursion. Dict keys are kept as they are.
+
+    value: <list, tuple, dict> Structure to rewrite (any other value is a
+           leaf itself)
+    find: <function> Called with each leaf, returns its new value (a
+          Finder works)
+    paths: <iterable> Dotted paths of the values to rewrite, with fnmatch
+           patterns for the keys and list indices ("keys.*.fpr"). A path
+           selects everything under it. None to rewrite every leaf
+    inplace: <bool> Rewrite the lists and dicts of `value` itself instead of
+             building new ones. Tuples can't be, they are replaced by lists
+    leaves: <tuple> Types of the leaves passed to `find`, the rest are kept
+
+    return value: <list, dict> The rewritten structure. Without `inplace`
+                  values that are not selected are shared with `value`
+    """
+    state = _patterns(paths)
+
+    if not isinstance(value, (list, tuple, dict)):
+        if state is None and isinstance(value, leaves) and \
+                not isinstance(value, bool):
+            return find(value)
+        return value
+
+    root = _container(value, inplace)
+    stack = [(value, root, state)]
+
+    while stack:
+        source, target, state = stack.pop()
+        items = source.items() if isinstance(source, dict) \
+            else enumerate(source)
+
+        for key, item in items:
+            child = _child(state, key)
+
+            if child == []:
+                result = item
+            elif isinstance(item, (list, tuple, dict)):
+                result = _container(item, inplace)
+                stack.append((item, result, child))
+            elif child is None and isinstance(item, leaves) and \
+                    not isinstance(item, bool):
+                result = find(item)
+            else:
+                result = item
+
+            if isinstance(target, dict) or target is source:
+                target[key] = result
+            else:
+                target.append(result)
+
+    return root
+
+
+def _container(value, inplace):
+    """The container a list, tuple or dict is rewritten to"""
+    if inplace and isinstance(value, (list, dict)):
+        return value
+
+    return {} if isinstance(value, dict) else []
@@ -0,0 +1,122 @@
+"""
+Recursive directory scanning. Files are listed in a deterministic (sorted)
+order, filtered by globs like grep's --include and --exclude, and read by a
+small thread pool ahead of the consumer, so reading overlaps with searching.
+"""
+import collections
+import fnmatch
+import os
+
+# Bytes checked for NUL to tell binary files apart, like grep
+BINARY_CHECK = 8192
+THREADS = 4
+
+
+def _matches(name, globs):
+    """Whether a file name matches any of the globs"""
+    return any(fnmatch.fnmatch(name, glob) for glob in globs)
+
+
+def walk(paths, include=(), exclude=(), exclude_dir=()):
+    """
+    Generator of the files under each path, in sorted order
+
+    paths: <iterable> Files and directories. Files given explicitly are
+           never filtered out
+    include: <iterable> Globs of file names to search, all if empty
+    exclude: <iterable> Globs of file names to skip
+    exclude_dir: <iterable> Globs of directory names to skip
+
+    return value: <generator> Yields the path of each file
+
+    Example:
+        >>> list(hexwordify.walk(["/etc/ssh"], include=["*.pub"]))
+            ['/etc/ssh/ssh_host_ed25519_key.pub',
+            '/etc/ssh/ssh_host_rsa_key.pub']
+    """
+    for path in paths:
+        if not os.path.isdir(path):
+            yield path
+            continue
+
+        stack = [path]
+
+        while stack:
+            directory = stack.pop()
+
+            try:
+                entries = sorted(os.scandir(directory),
+                                 key=lambda entry: entry.name)
+            except OSError:
+                continue
+
+            subdirectories = []
+
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if not _matches(entry.name, exclude_dir):
+                        subdirectories.append(entry.path)
+                    continue
+
+                if not entry.is_file():
+                    continue
+
+                if include and not _matches(entry.name, include):
+                    continue
+
+                if not _matches(entry.name, exclude):
+                    yield entry.path
+
+            # Files of a directory come before its subdirectories, which are
+            # popped in sorted order
+            stack.extend(reversed(subdirectories))
+
+
+def read_text(path):
+    """
+    Reads a text file, returns None if it is binary (has a NUL byte in its
+    first BINARY_CHECK bytes) or can't be read
+    """
+    try:
+        with open(path, "rb") as fileo:
+            # Binary files are skipped without reading all of them
+            data = fileo.read(BINARY_CHECK)
+            if b"\0" in data:
+                return None
+
+            data += fileo.read()
+    except OSError:
+        return None
+
+    return data.decode(errors="replace")
+
+
+def read_files(paths, threads=THREADS):
+    """
+    Generator that reads files with a thread pool, a few files ahead of the
+    consumer. Files are yielded in the order of `paths`.
+
+    paths: <iterable> Files to read
+    threads: <int> Threads reading, at most twice as many files are read
+             ahead
+
+    return value: <generator> Yields (path, text) for each file, text is
+                  None for binary or unreadable files
+    """
+    # Imported here, concurrent.futures is slow to import
+    from concurrent.futures import ThreadPoolExecutor
+
+    pending = collections.deque()
+
+    with ThreadPoolExecutor(threads) as executor:
+        for path in paths:
+            pending.append((path, executor.submit(read_text, path)))
+
+            # Bound the files in flight (and in memory)
+            if len(pending) >= threads * 2:
+                path, future = pending.popleft()
+                yield path, future.result()
+
+        while pending:
+            path, future = pending.popleft()
+            yield path, future.result()
@@ -0,0 +1,233 @@
+"""
+Wordlist registry. Wordlists are plain text files with one word per line
+(lines like the EFF "11111	abacus" use their last field). Each file is
+validated once and compiled to a cached binary file (a header, an offsets
+array and the joined words) that is memory mapped on later runs.
+Nothing is loaded until a wordlist is used.
+"""
+import array
+import importlib
+import mmap
+import os
+import struct
+import sys
+from collections.abc import Sequence
+
+MAGIC = b"HWL1"
+HEADER = struct.Struct("<4sI")
+
+# Name: path of the source file
+_REGISTRY = {}
+# Built-in lists, name: (module, attribute)
+_BUILTIN = {
+    "bip39": ("hexwordify.bip_0039", "WORDLIST"),
+}
+# Loaded lists, name or absolute path of the file: (mtime, size, wordlist).
+# The times and sizes are None for the built-in lists
+_LOADED = {}
+
+
+class CompiledWordlist(Sequence):
+    """
+    Read-only sequence of words backed by a compiled wordlist file.
+    Words are decoded only when accessed.
+
+    path: <str> Compiled wordlist file
+    """
+    def __init__(self, path):
+        self.path = path
+
+        with open(path, "rb") as fileo:
+            self._map = mmap.mmap(fileo.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, count = HEADER.unpack_from(self._map)
+        if magic != MAGIC:
+            raise ValueError("'%s' is not a compiled wordlist" % path)
+
+        end = HEADER.size + 4 * (count + 1)
+        offsets = memoryview(self._map)[HEADER.size:end].cast("I")
+
+        if sys.byteorder == "big":
+            offsets = array.array("I", offsets)
+            offsets.byteswap()
+
+        self._offsets = offsets
+        self._data = end
+        self._count = count
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._count))]
+
+        if index < 0:
+            index += self._count
+
+        if not 0 <= index < self._count:
+            raise IndexError("Wordlist index out of range")
+
+        return self._map[self._data + self._offsets[index]:
+                         self._data + self._offsets[index + 1]].decode()
+
+    def __repr__(self):
+        return "CompiledWordlist(%r)" % self.path
+
+    def __reduce__(self):
+        # Other processes map the file again
+        return CompiledWordlist, (self.path,)
+
+
+def cache_dir():
+    """Directory of the compiled wordlists"""
+    base = os.environ.get("XDG_CACHE_HOME") or \
+        os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "hexwordify")
+
+
+def parse(path):
+    """
+    Reads and validates a plain text wordlist
+
+    path: <str> File with one word per line
+
+    return value: <list> The words
+    """
+    words = []
+
+    with open(path, encoding="utf-8") as fileo:
+        for line in fileo:
+            fields = line.split()
+            if fields and not fields[0].startswith("#"):
+                words.append(fields[-1])
+
+    if len(words) < 2:
+        raise ValueError("Wordlist '%s' needs at least 2 words" % path)
+
+    if len(set(words)) != len(words):
+        raise ValueError("Wordlist '%s' has duplicate words" % path)
+
+    return words
+
+
+def compile_wordlist(words, path):
+    """
+    Writes a compiled wordlist file
+
+    words: <iterable> Words to compile
+    path: <str> Where to write it
+    """
+    data = [word.encode() for word in words]
+    offsets = array.array("I", [0])
+    for word in data:
+        offsets.append(offsets[-1] + len(word))
+
+    if sys.byteorder == "big":
+        offsets.byteswap()
+
+    # Write and rename, so concurrent runs never see half a file
+    temp = "%s.%d.tmp" % (path, os.getpid())
+    with open(temp, "wb") as fileo:
+        fileo.write(HEADER.pack(MAGIC, len(data)))
+        fileo.write(offsets.tobytes())
+        fileo.write(b"".join(data))
+
+    os.replace(temp, path)
+
+
+def _compiled_path(source):
+    """Cache path of a source file, it changes when the source changes"""
+    # Imported here, the builtin wordlist doesn't need it
+    import hashlib
+
+    source = os.path.abspath(source)
+    stat = os.stat(source)
+    digest = hashlib.sha1(("%s:%d:%d" % (source, stat.st_mtime_ns,
+                                         stat.st_size)).encode()).hexdigest()
+    name = os.path.splitext(os.path.basename(source))[0]
+    return os.path.join(cache_dir(), "%s-%s.hwl" % (name, digest[:16]))
+
+
+def load_file(source):
+    """
+    Loads a plain text wordlist, compiling it on first use
+
+    source: <str> File with one word per line
+
+    return value: <CompiledWordlist> The wordlist
+    """
+    compiled = _compiled_path(source)
+
+    if not os.path.exists(compiled):
+        words = parse(source)
+        os.makedirs(os.path.dirname(compiled), exist_ok=True)
+        compile_wordlist(words, compiled)
+
+    return CompiledWordlist(compiled)
+
+
+def register(name, source):
+    """
+    Registers a wordlist file under a name. It is loaded on first `get`
+
+    name: <str> Name of the wordlist
+    source: <str> File with one word per line
+    """
+    _REGISTRY[name] = os.path.abspath(source)
+
+
+def available():
+    """Names of the registered wordlists"""
+    return sorted(set(_BUILTIN) | set(_REGISTRY))
+
+
+def get(name):
+    """
+    Returns a wordlist by registered name or file path
+
+    name: <str> Registered name or path of a plain text wordlist
+
+    return value: <tuple, CompiledWordlist> The wordlist
+
+    Example:
+        >>> hexwordify.wordlists.register("eff", "eff_large_wordlist.txt")
+        >>> len(hexwordify.wordlists.get("eff"))
+            7776
+    """
+    if name in _REGISTRY:
+        return _load_cached(_REGISTRY[name])
+
+    if name in _BUILTIN:
+        if name not in _LOADED:
+            module, attribute = _BUILTIN[name]
+            _LOADED[name] = (None, None, getattr(
+                importlib.import_module(module), attribute))
+        return _LOADED[name][2]
+
+    if os.path.isfile(name):
+        return _load_cached(name)
+
+    raise KeyError("Unknown wordlist '%s', available: %s" %
+                   (name, ", ".join(available())))
+
+
+def _load_cached(source):
+    """
+    `load_file` through the loaded lists. They are kept by absolute path
+    (the daemon changes to the directory of each client) and loaded again
+    when the file changes
+    """
+    source = os.path.abspath(source)
+    stat = os.stat(source)
+
+    try:
+        mtime, size, wordlist = _LOADED[source]
+        if (mtime, size) == (stat.st_mtime_ns, stat.st_size):
+            return wordlist
+    except KeyError:
+        pass
+
+    wordlist = load_file(source)
+    _LOADED[source] = (stat.st_mtime_ns, stat.st_size, wordlist)
+    return wordlist
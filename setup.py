@@ -10,9 +10,15 @@ setup(
 
     packages=["hexwordify"],
 
+    extras_require={
+        # Vectorized transform_many
+        "numpy": ["numpy"],
+    },
+
     entry_points={
         "console_scripts": [
             "hexwordify=hexwordify.__main__:main",
+            "hexwordify-client=hexwordify.client:main",
         ],
     },
 )
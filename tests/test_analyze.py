@@ -0,0 +1,43 @@
+"""
+`analyze` against comparing every pair of phrases
+"""
+import itertools
+import hexwordify
+from hexwordify.analyze import _pair, _phrases
+from hexwordify.hexwordify import _word_bits
+from test_decode import hex_strings
+
+WORDS = [word.strip() for word in hexwordify.WORDLIST]
+
+
+def keys(phrase):
+    """The phrase and the phrase with each word deleted"""
+    return {phrase} | {phrase[:drop] + phrase[drop + 1:]
+                       for drop in range(len(phrase))}
+
+
+def every_pair(fingerprints, k, max_distance):
+    """The pairs `analyze` finds, comparing every pair"""
+    names, phrases = zip(*_phrases(fingerprints, k,
+                                   _word_bits(hexwordify.WORDLIST)))
+    shared = [keys(phrase) for phrase in phrases]
+    pairs = set()
+
+    for first, second in itertools.combinations(range(len(phrases)), 2):
+        if shared[first] & shared[second]:
+            pair = _pair(names, phrases, WORDS, first, second, max_distance)
+            if pair is not None:
+                pairs.add(pair)
+
+    return pairs
+
+
+def test_same_as_every_pair():
+    # Most 40 digit phrases start with the same word, small k gives many
+    # close pairs
+    fingerprints = hex_strings(40, 200)
+
+    for k in (2, 3):
+        for max_distance in (None, 0, 1, 2):
+            assert set(hexwordify.analyze(fingerprints, k, max_distance)) == \
+                every_pair(fingerprints, k, max_distance)
@@ -0,0 +1,74 @@
+"""
+Console function
+"""
+import io
+import random
+import re
+import pytest
+from hexwordify.cli import main
+from hexwordify.filescan import scan_mapped
+
+
+def run(argv, stdin=""):
+    """Output of the console function, as bytes"""
+    stdout = io.TextIOWrapper(io.BytesIO(), write_through=True)
+    main(argv, io.StringIO(stdin), stdout)
+    stdout.flush()
+    return stdout.buffer.getvalue()
+
+
+def test_format_arguments_are_searched():
+    assert run(["--format", "tsv", "key:DEADBEEF"]) == (
+        b"source\tline\toffset\thex\twords\n"
+        b"\t1\t1\te\tbright\n"
+        b"\t1\t3\t:DEADBEEF\tdash fork upon length\n")
+
+
+def test_format_non_hex_argument():
+    assert run(["--format", "jsonl", "zzz"]) == b""
+    assert run(["--format", "tsv", "zzz"]) == \
+        b"source\tline\toffset\thex\twords\n"
+
+
+def test_reverse_arguments_are_a_phrase():
+    assert run(["-c", "--reverse", "assume", "fine", "wing", "wink",
+                "pumpkin", "wash", "scale"]) == b"deadbeefdeadbeef\n"
+    assert run(["-c", "--reverse", "--min-words", "4", "dash", "fork",
+                "upon", "length"]) == b"deadbeef\n"
+
+
+def test_mmap_same_as_read(tmp_path):
+    rand = random.Random(1814)
+    pieces = ("DEADBEEF", "0x" + "ab" * 20, "1814E2AFF5E59A004BA2109EBEA53D73",
+              "::", " ", "  ", "\t", "\n", "\n\n", "key", "é")
+    files = []
+
+    for number in range(40):
+        path = tmp_path / ("%d.txt" % number)
+        path.write_bytes("".join(rand.choice(pieces) for _ in range(
+            rand.randint(0, 30))).encode())
+        files.append(str(path))
+
+    for options in ([], ["-r"], ["-p"], ["-c"], ["-s", "8"],
+                    ["-r", "-s", "4"]):
+        argv = options + [item for path in files for item in ("-f", path)]
+        assert run(["-m"] + argv) == run(argv)
+
+
+def test_mmap_windows():
+    rand = random.Random(1814)
+    data = "".join(rand.choice(("DEADBEEF", "0x1234", ":", " ", "x", "\n"))
+                   for _ in range(2000)).encode()
+    regex = re.compile(rb"(?:0x)?[0-9a-f:]{8,}", re.I | re.M)
+    expected = [(match.start(), match.end(), match.group(0).decode())
+                for match in regex.finditer(data)]
+
+    # Hex strings straddle the windows
+    for window in (1, 7, 64, 1000):
+        assert list(scan_mapped(data, 8, window)) == expected
+
+
+def test_jobs_at_least_one():
+    for jobs in ("-1", "0"):
+        with pytest.raises(SystemExit):
+            run(["-j", jobs])
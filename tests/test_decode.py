@@ -0,0 +1,51 @@
+"""
+Round trips of `decode` over `transform`
+"""
+import random
+import hexwordify
+
+# Lengths of the usual hex strings: md5 (and GUIDs), sha1 (and OpenPGP v4
+# fingerprints), sha256
+LENGTHS = (32, 40, 64)
+
+
+def hex_strings(length, count=500, seed=1814):
+    """Random hex strings of `length` digits"""
+    rand = random.Random(seed + length)
+    return ["%0*x" % (length, rand.getrandbits(length * 4))
+            for _ in range(count)]
+
+
+def test_round_trip_guessed_length():
+    for length in LENGTHS:
+        for string in hex_strings(length):
+            # Leading zero digits can't always be told apart from a shorter
+            # string, those need the length
+            if string.startswith("0"):
+                continue
+
+            assert hexwordify.decode(hexwordify.transform(string)) == string
+
+
+def test_round_trip_given_length():
+    for length in LENGTHS:
+        for string in hex_strings(length):
+            words = hexwordify.transform(string)
+            assert hexwordify.decode(words, length=length) == string
+
+
+def test_guess_is_whole_bytes():
+    for length in LENGTHS:
+        for string in hex_strings(length):
+            guess = hexwordify.decode(hexwordify.transform(string))
+            assert len(guess) % 2 == 0
+
+
+def test_round_trip_radix():
+    wordlist = tuple("w%d" % i for i in range(7776))
+
+    for length in LENGTHS:
+        for string in hex_strings(length, 100):
+            words = hexwordify.transform(string, wordlist, radix=True)
+            assert hexwordify.decode(words, wordlist, length=length,
+                                     radix=True) == string
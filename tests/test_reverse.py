@@ -0,0 +1,31 @@
+"""
+Round trips of `ReverseFinder` over `transform`, with the phrases in text
+"""
+import hexwordify
+from test_decode import LENGTHS, hex_strings
+
+PROSE = "The key is %s and that is all"
+
+
+def test_round_trip_in_prose():
+    find = hexwordify.ReverseFinder()
+
+    for length in LENGTHS:
+        for string in hex_strings(length):
+            # Same as `decode`, leading zero digits need the length
+            if string.startswith("0"):
+                continue
+
+            text = PROSE % " ".join(hexwordify.transform(string))
+            assert find.findall(text) == [string]
+            assert find.sub(text) == PROSE % string
+
+
+def test_trimmed_words():
+    find = hexwordify.ReverseFinder(min_words=4)
+
+    assert find.sub("key: dash fork upon length") == "key: deadbeef"
+    assert find.findall("dash fork upon length, crawl word program "
+                        "abandon") == ["deadbeef", "cafebabe"]
+    assert hexwordify.reverse_finder("fpr: assume fine wing wink pumpkin "
+                                     "wash scale") == "fpr: deadbeefdeadbeef"
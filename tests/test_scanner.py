@@ -0,0 +1,43 @@
+"""
+`scan` against the `finder` regex
+"""
+import random
+import re
+import hexwordify
+
+# Hex digits, colons, "0x" prefixes and a few of everything else
+ALPHABET = "0123456789abcdefABCDEF::xXxX0g z\né€"
+
+
+def texts(count=2000, seed=1814):
+    """Random texts, dense in hex runs and "0x" prefixes"""
+    rand = random.Random(seed)
+    return ["".join(rand.choice(ALPHABET) for _ in range(rand.randint(0, 60)))
+            for _ in range(count)]
+
+
+def regex_spans(string, min_size):
+    """Spans of the matches of the `finder` regex"""
+    regex = re.compile(r"(?:0x)?[0-9a-f:]{%s,}" % min_size, re.I | re.M)
+    return [match.span() for match in regex.finditer(string)]
+
+
+def test_same_as_regex():
+    for string in texts():
+        for min_size in (1, 2, 3, 5, 8):
+            assert list(hexwordify.scan(string, min_size)) == \
+                regex_spans(string, min_size)
+
+
+def test_same_as_regex_bytes():
+    for string in texts(500):
+        data = string.encode("latin-1", "replace")
+        for min_size in (1, 4):
+            assert list(hexwordify.scan(data, min_size)) == \
+                regex_spans(data.decode("latin-1"), min_size)
+
+
+def test_finder_engines():
+    for string in texts(500):
+        assert hexwordify.Finder(4, engine="scan").sub(string) == \
+            hexwordify.Finder(4).sub(string)
@@ -0,0 +1,82 @@
+"""
+`transform` against the chunked layout it replaced, and `transform_many`
+against `transform`
+"""
+import math
+import random
+import hexwordify
+
+WORDLISTS = (hexwordify.WORDLIST, tuple("w%d" % i for i in range(7776)),
+             tuple("w%d" % i for i in range(16)), ("no", "yes"))
+
+
+def chunked_transform(string, wordlist):
+    """`transform` as it was, parsing 128 character chunks"""
+    dictlist = []
+    string = string.replace(":", "")
+    logarithm = int(math.log(len(wordlist), 2))
+    mask = 2**logarithm - 1
+
+    for i in range(0, int(len(string) / 128) + bool(len(string) % 128)):
+        hex_string = int(string[i * 128:(i + 1) * 128], 16)
+        hex_string = hex_string << ((len(string) * 4) % logarithm)
+
+        while hex_string > 0:
+            dictlist.insert(0, wordlist[hex_string & mask].strip())
+            hex_string = hex_string >> logarithm
+
+    return dictlist
+
+
+def hex_strings(count=1000, seed=1814):
+    """
+    Random hex strings of up to one chunk (128 characters without colons),
+    with mixed case, colons and "0x" prefixes
+    """
+    rand = random.Random(seed)
+
+    for _ in range(count):
+        prefix = rand.choice(("", "", "0x", "0X"))
+        digits = "".join(rand.choice("0123456789abcdefABCDEF")
+                         for _ in range(rand.randint(1, 128 - len(prefix))))
+        # Colons between pairs of digits, like fingerprints
+        if rand.random() < 0.3:
+            digits = ":".join(digits[i:i + 2]
+                              for i in range(0, len(digits), 2))
+        yield prefix + digits
+
+
+def test_same_as_chunked():
+    for wordlist in WORDLISTS:
+        for string in hex_strings():
+            assert hexwordify.transform(string, wordlist) == \
+                chunked_transform(string, wordlist)
+            assert list(hexwordify.transform_iter(string, wordlist)) == \
+                chunked_transform(string, wordlist)
+
+
+
+def batch():
+    """Mixed strings, with fixed width batches like fingerprints"""
+    strings = list(hex_strings(500))
+    strings += ["%040x" % random.Random(i).getrandbits(160)
+                for i in range(300)]
+    strings += ["%063X" % random.Random(i).getrandbits(252)
+                for i in range(300)]
+    return strings
+
+
+def test_transform_many():
+    strings = batch()
+
+    for wordlist in WORDLISTS:
+        assert hexwordify.transform_many(strings, wordlist) == \
+            [hexwordify.transform(string, wordlist) for string in strings]
+
+
+def test_transform_many_without_numpy(monkeypatch):
+    monkeypatch.setattr("hexwordify.hexwordify._NUMPY", None)
+    strings = batch()
+
+    assert hexwordify.transform_many(strings) == \
+        [hexwordify.transform(string) for string in strings]
@@ -0,0 +1,33 @@
+"""
+Loaded wordlists and what is kept for each of them
+"""
+import gc
+import importlib
+import os
+from hexwordify import wordlists
+
+cache = importlib.import_module("hexwordify.cache")
+decode = importlib.import_module("hexwordify.decode")
+
+
+def test_reloaded_wordlists_are_freed(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    path = tmp_path / "words.txt"
+    ids, indexes = len(cache._WORDLIST_IDS), len(decode._INDEXES)
+
+    for number in range(5):
+        path.write_text("\n".join("w%d_%d" % (number, i) for i in range(256)))
+        # Another mtime, even on coarse clocks
+        os.utime(path, ns=(number * 10**9, number * 10**9))
+        wordlist = wordlists.get(str(path))
+
+        words = "w%d_1 w%d_2" % (number, number)
+        assert decode.decode(words, wordlist) == "0102"
+        cache.cache_key("dead", wordlist)
+
+    del wordlist
+    gc.collect()
+
+    # Only the wordlist loaded now is kept
+    assert len(cache._WORDLIST_IDS) == ids + 1
+    assert len(decode._INDEXES) == indexes + 1